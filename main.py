@@ -1,3 +1,9 @@
+# PyOpenGL comprueba glGetError después de cada llamada; se desactiva antes
+# del primer import de OpenGL.GL para quitar ese coste de todo el renderizado
+import OpenGL
+OpenGL.ERROR_CHECKING = False
+OpenGL.ERROR_LOGGING = False
+
 from src.states.gameplay_state import GameplayState
 from src.states.welcome_state import WelcomeState
 from src.core.window_manager import WindowManager
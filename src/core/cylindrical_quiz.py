@@ -1940,8 +1940,7 @@ class CylindricalQuizState(BaseState):
         # Lower volume again since we're returning to planet detail
         audio.lower_music_volume(0.4)
 
-        self.input_manager.key_state.clear()
-        self.input_manager.special_key_state.clear()
+        self.input_manager.clear()
 
     def _on_quiz_complete(self, passed, score, strikes):
         """Called when quiz is completed."""
@@ -1,3 +1,39 @@
+from OpenGL.GLUT import GLUT_KEY_UP, GLUT_KEY_DOWN, GLUT_KEY_LEFT, GLUT_KEY_RIGHT
+
+# Bits del estado empaquetado devuelto por InputManager.state_mask()
+KEY_W = 1 << 0
+KEY_A = 1 << 1
+KEY_S = 1 << 2
+KEY_D = 1 << 3
+KEY_LEFT = 1 << 4
+KEY_RIGHT = 1 << 5
+KEY_UP = 1 << 6
+KEY_DOWN = 1 << 7
+KEY_SPACE = 1 << 8
+
+# Máscaras combinadas (tecla de letra | flecha equivalente)
+MASK_FORWARD = KEY_W | KEY_UP
+MASK_BACKWARD = KEY_S | KEY_DOWN
+MASK_TURN_LEFT = KEY_A | KEY_LEFT
+MASK_TURN_RIGHT = KEY_D | KEY_RIGHT
+MASK_MOVEMENT = MASK_FORWARD | MASK_BACKWARD | MASK_TURN_LEFT | MASK_TURN_RIGHT
+
+_KEY_BITS = {
+    'w': KEY_W,
+    'a': KEY_A,
+    's': KEY_S,
+    'd': KEY_D,
+    ' ': KEY_SPACE,
+}
+
+_SPECIAL_KEY_BITS = {
+    GLUT_KEY_LEFT: KEY_LEFT,
+    GLUT_KEY_RIGHT: KEY_RIGHT,
+    GLUT_KEY_UP: KEY_UP,
+    GLUT_KEY_DOWN: KEY_DOWN,
+}
+
+
 class InputManager:
     """
     Singleton que gestiona el estado de las teclas para permitir
@@ -10,6 +46,7 @@ class InputManager:
             cls._instance = super(InputManager, cls).__new__(cls)
             cls._instance.key_state = {}
             cls._instance.special_key_state = {}
+            cls._instance._mask = 0
         return cls._instance
 
     def key_down(self, key, x, y):
@@ -21,6 +58,7 @@ class InputManager:
             except:
                 pass
         self.key_state[key] = True
+        self._mask |= _KEY_BITS.get(key, 0)
 
     def key_up(self, key, x, y):
         """Registra que una tecla normal ha sido soltada."""
@@ -30,14 +68,27 @@ class InputManager:
             except:
                 pass
         self.key_state[key] = False
+        self._mask &= ~_KEY_BITS.get(key, 0)
 
     def special_key_down(self, key, x, y):
         """Registra que una tecla especial (flechas, F1, etc) ha sido presionada."""
         self.special_key_state[key] = True
+        self._mask |= _SPECIAL_KEY_BITS.get(key, 0)
 
     def special_key_up(self, key, x, y):
         """Registra que una tecla especial ha sido soltada."""
         self.special_key_state[key] = False
+        self._mask &= ~_SPECIAL_KEY_BITS.get(key, 0)
+
+    def release_key(self, key):
+        """Marca una tecla normal como soltada sin esperar al callback."""
+        self.key_up(key, 0, 0)
+
+    def clear(self):
+        """Suelta todas las teclas (normales y especiales)."""
+        self.key_state.clear()
+        self.special_key_state.clear()
+        self._mask = 0
 
     def is_key_pressed(self, key):
         """Retorna True si la tecla está presionada."""
@@ -47,3 +98,11 @@ class InputManager:
     def is_special_key_pressed(self, key):
         """Retorna True si la tecla especial está presionada."""
         return self.special_key_state.get(key, False)
+
+    def state_mask(self):
+        """
+        Retorna el estado de las teclas de vuelo (WASD, flechas y espacio)
+        empaquetado en un entero. Se mantiene incrementalmente en los
+        callbacks, así que la consulta es una sola lectura por frame.
+        """
+        return self._mask
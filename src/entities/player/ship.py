@@ -1,15 +1,79 @@
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 from src.entities.base.renderable import Renderable
-from src.core.input_manager import InputManager
+from src.core.input_manager import (
+    InputManager, KEY_SPACE, MASK_FORWARD, MASK_BACKWARD,
+    MASK_TURN_LEFT, MASK_TURN_RIGHT)
 from src.core.session import GameContext
 from src.core.audio_manager import get_audio_manager
+from src.utils.math_helper import (
+    quat_from_axis_angle, quat_multiply, quat_nlerp, quat_to_matrix)
 # Import actual ship models
 from src.entities.player.ships.shipM import ShipModel
 from src.entities.player.ships.shipS import dibujar_nave as draw_ship_s
 from src.entities.player.ships.shipZ import draw_nave as draw_ship_z
 import math
 
+# Target pitch (around X) and bank (around Z) for every lean the controls
+# can request. They ease separately so each keeps its own response rate.
+_PITCH_TARGETS = {pitch: quat_from_axis_angle((1.0, 0.0, 0.0), pitch)
+                  for pitch in (-10.0, 0.0, 10.0)}
+_BANK_TARGETS = {tilt: quat_from_axis_angle((0.0, 0.0, 1.0), tilt)
+                 for tilt in (-15.0, 0.0, 15.0)}
+
+# Half turn around Y so the UFO model faces forward
+_FACE_FORWARD = quat_from_axis_angle((0.0, 1.0, 0.0), 180.0)
+
+def _ease_quat(current, target, blend):
+    """
+    Acerca `current` hacia `target` con nlerp y lo fija al objetivo cuando
+    ya está lo bastante cerca, para que la matriz cacheada deje de cambiar.
+    """
+    q = quat_nlerp(current, target, min(blend, 1.0))
+    if abs(q[0] * target[0] + q[1] * target[1] +
+           q[2] * target[2] + q[3] * target[3]) > 1.0 - 1e-9:
+        q = target
+    return q
+
+
+def _integrate_motion(position, velocity, rotation_y, accel, friction, dt,
+                      max_speed, max_speed_sq):
+    """
+    Avanza un paso de física en el plano XZ, modificando position y
+    velocity in place. Trabaja sobre locales para evitar accesos repetidos
+    a atributos y listas en el camino caliente.
+    """
+    vx = velocity[0]
+    vz = velocity[2]
+
+    # Aplicar aceleración en la dirección hacia donde mira la nave.
+    # En OpenGL -Z es "adelante": rotation_y = 0 -> mira a -Z
+    # x = -sin(angle), z = -cos(angle)
+    if accel:
+        rad = math.radians(rotation_y)
+        accel_dt = accel * dt
+        vx -= math.sin(rad) * accel_dt
+        vz -= math.cos(rad) * accel_dt
+
+    # Friction (space-like inertia simulated)
+    vx *= friction
+    vz *= friction
+
+    # Update position
+    position[0] += vx * dt
+    position[2] += vz * dt
+
+    # Cap the horizontal speed to a maximum to avoid runaway velocities
+    speed_sq = vx * vx + vz * vz
+    if speed_sq > max_speed_sq:
+        scale = max_speed / math.sqrt(speed_sq)
+        vx *= scale
+        vz *= scale
+
+    velocity[0] = vx
+    velocity[2] = vz
+
+
 # Singleton ship model instance (created once, reused)
 _ufo_model_instance = None
 
@@ -28,8 +92,11 @@ class Ship(Renderable):
         self.position = list(position)  # [x, y, z]
         self.velocity = [0.0, 0.0, 0.0]
         self.rotation_y = 0.0  # Yaw
-        self.tilt_angle = 0.0  # Roll (banking)
-        self.pitch_angle = 0.0  # Pitch (forward tilt)
+        # Pitch (forward tilt) and roll (banking) as unit quaternions
+        # (w, x, y, z); orientation is their product (pitch, then bank)
+        self._pitch_q = (1.0, 0.0, 0.0, 0.0)
+        self._bank_q = (1.0, 0.0, 0.0, 0.0)
+        self.orientation = (1.0, 0.0, 0.0, 0.0)
         self.speed = 0.0
 
         self.input_manager = InputManager()
@@ -75,15 +142,47 @@ class Ship(Renderable):
 
         # Global speed multiplier to easily scale ship movement across the game
         # Increase this value to make the ship move much faster in gameplay
-        # Global speed multiplier to easily scale ship movement across the game
-        # Reduced to 1.5 to tone down the speed (half of previous 3.0 per user feedback)
         self.speed_multiplier = 1
 
+        # Boost-dependent limits, refreshed only when is_boosting flips
+        self._refresh_speed_limits()
+
         # Cache animation state dict to avoid per-frame allocation
         self._anim_state = {"hover_y": 0.0, "balanceo_pata_z": 0.0}
 
+        # Composed model matrix, rebuilt only when the orientation changes
+        self._model_matrix = None
+        self._model_matrix_key = None
+
         # Don't compile display list - ship models handle their own optimization
 
+    def _refresh_speed_limits(self):
+        """Recompute the acceleration and speed cap for the current boost state."""
+        boost = self.boost_accel_multiplier if self.is_boosting else 1.0
+        self._cur_accel = self.acceleration * boost * self.speed_multiplier
+        # Allow a slightly higher maximum speed while boosting (40% higher)
+        self._max_speed_allowed = self.max_speed * self.speed_multiplier * (
+            1.4 if self.is_boosting else 1.0)
+        self._max_speed_allowed_sq = self._max_speed_allowed * self._max_speed_allowed
+
+    def _get_model_matrix(self):
+        """
+        Gameplay scale plus pitch/bank orientation for the selected model
+        as one matrix. Cached until the orientation or the model changes.
+        """
+        key = (self.orientation, self.selected_ship)
+        if key != self._model_matrix_key:
+            if self.selected_ship == 'shipM':
+                # Scale for gameplay, face forward, then pitch and bank
+                self._model_matrix = quat_to_matrix(
+                    quat_multiply(_FACE_FORWARD, self.orientation), 0.3)
+            else:
+                # Inverted because shipS has internal 180 flip
+                w, x, y, z = self.orientation
+                self._model_matrix = quat_to_matrix((w, -x, y, -z), 0.6)
+            self._model_matrix_key = key
+        return self._model_matrix
+
     def _draw_geometry(self):
         """
         Dibuja la nave seleccionada.
@@ -94,21 +193,14 @@ class Ship(Renderable):
         if self.selected_ship == 'shipM':
             # Draw UFO model
             glPushMatrix()
-            glScalef(0.3, 0.3, 0.3)  # Scale for gameplay
-            glRotatef(180, 0, 1, 0)  # Face forward
-            glRotatef(self.pitch_angle, 1, 0, 0)  # Apply Pitch (Nose Down)
-            glRotatef(self.tilt_angle, 0, 0, 1)  # Apply tilt (Bank)
+            glMultMatrixf(self._get_model_matrix())
             self.ufo_model.draw()
             glPopMatrix()
 
         elif self.selected_ship == 'shipS':
             # Draw Bug Crawler
             glPushMatrix()
-            glScalef(0.6, 0.6, 0.6)  # Scale for gameplay
-
-            # Apply tilt (Bank) - Inverted because shipS has internal 180 flip
-            glRotatef(-self.pitch_angle, 1, 0, 0)  # Apply Pitch (Nose Down)
-            glRotatef(-self.tilt_angle, 0, 0, 1)
+            glMultMatrixf(self._get_model_matrix())
 
             # Reuse cached animation state dict
             self._anim_state["hover_y"] = math.sin(
@@ -162,12 +254,16 @@ class Ship(Renderable):
             self.boost_duration -= dt
             if self.boost_duration <= 0:
                 self.is_boosting = False
+                self._refresh_speed_limits()
                 # Fade out boost sound when boost ends
                 if self.boost_sound_channel and self.boost_sound_channel.get_busy():
                     self.boost_sound_channel.fadeout(300)
 
+        # Estado de todas las teclas de vuelo en una sola consulta
+        keys = self.input_manager.state_mask()
+
         # Activar Boost (Espacio)
-        if self.input_manager.is_key_pressed(' ') and self.boost_cooldown <= 0:
+        if keys & KEY_SPACE and self.boost_cooldown <= 0:
             # Play boost sound immediately (before setting state for snappier response)
             audio = get_audio_manager()
             self.boost_sound_channel = audio.play_sfx('boost', volume_scale=1.0)
@@ -175,79 +271,51 @@ class Ship(Renderable):
             self.is_boosting = True
             self.boost_duration = self.boost_duration_max
             self.boost_cooldown = self.boost_cooldown_time
+            self._refresh_speed_limits()
 
         # 1. Rotación (A/D o Flechas Izq/Der)
-        target_tilt = 0.0
-        if self.input_manager.is_key_pressed('a') or self.input_manager.is_special_key_pressed(GLUT_KEY_LEFT):
-            self.rotation_y += self.turn_speed * dt
-            target_tilt = -15.0  # Bank left (Reversed)
-        if self.input_manager.is_key_pressed('d') or self.input_manager.is_special_key_pressed(GLUT_KEY_RIGHT):
-            self.rotation_y -= self.turn_speed * dt
-            target_tilt = 15.0  # Bank right (Reversed)
-
-        # Smoothly interpolate tilt
-        # Faster return to 0 than entry
-        tilt_speed = 5.0 * dt
-        if target_tilt == 0.0:
-            tilt_speed *= 1.5
-
-        self.tilt_angle += (target_tilt - self.tilt_angle) * tilt_speed
+        # +1 izquierda, -1 derecha, 0 si ninguna (o ambas) pulsadas
+        turn_sign = ((keys & MASK_TURN_LEFT) != 0) - ((keys & MASK_TURN_RIGHT) != 0)
+        if turn_sign:
+            self.rotation_y += turn_sign * self.turn_speed * dt
+        target_tilt = -15.0 * turn_sign  # Bank into the turn (Reversed)
 
         # 2. Aceleración (W/S o Flechas Arr/Abj)
-        # Apply global speed multiplier so the ship moves faster if required
-        current_accel = self.acceleration * \
-            (self.boost_accel_multiplier if self.is_boosting else 1.0) * \
-            self.speed_multiplier
-
-        accel = 0.0
-        target_pitch = 0.0
-        if self.input_manager.is_key_pressed('w') or self.input_manager.is_special_key_pressed(GLUT_KEY_UP):
-            accel = current_accel
-            target_pitch = 10.0  # Lean forward
-        elif self.input_manager.is_key_pressed('s') or self.input_manager.is_special_key_pressed(GLUT_KEY_DOWN):
-            accel = -current_accel
-            target_pitch = -10.0  # Lean backward
-
-        # Smoothly interpolate pitch
-        pitch_speed = 5.0 * dt
-        self.pitch_angle += (target_pitch - self.pitch_angle) * pitch_speed
-
-        # Calcular vector dirección (Hacia donde mira la nave)
-        # En OpenGL -Z es "adelante".
-        # rotation_y = 0 -> Mira a -Z
-        # x = -sin(angle), z = -cos(angle)
-        rad = math.radians(self.rotation_y)
-        dir_x = -math.sin(rad)
-        dir_z = -math.cos(rad)
-
-        # Aplicar aceleración a la velocidad
-        self.velocity[0] += dir_x * accel * dt
-        self.velocity[2] += dir_z * accel * dt
-
-        # 3. Friction (space-like inertia simulated)
-        self.velocity[0] *= self.friction
-        self.velocity[2] *= self.friction
-
-        # 4. Update position
-        self.position[0] += self.velocity[0] * dt
-        self.position[2] += self.velocity[2] * dt
-
-        # Cap the horizontal speed to a maximum to avoid runaway velocities
-        hspeed = math.sqrt(
-            self.velocity[0] * self.velocity[0] + self.velocity[2] * self.velocity[2])
-        # Allow a slightly higher maximum speed while boosting (40% higher)
-        max_speed_allowed = self.max_speed * self.speed_multiplier * (
-            1.4 if self.is_boosting else 1.0)
-        if hspeed > max_speed_allowed and hspeed > 0:
-            # scale down velocities to cap
-            scale = max_speed_allowed / hspeed
-            self.velocity[0] *= scale
-            self.velocity[2] *= scale
+        # +1 adelante, -1 atrás, 0 si ninguna; con ambas gana adelante
+        accel_sign = 1 if keys & MASK_FORWARD else -1 if keys & MASK_BACKWARD else 0
+        accel = accel_sign * self._cur_accel
+        target_pitch = 10.0 * accel_sign  # Lean forward / backward
+
+        # Smoothly rotate towards the target pitch and bank
+        pitch_target = _PITCH_TARGETS[target_pitch]
+        bank_target = _BANK_TARGETS[target_tilt]
+        if self._pitch_q != pitch_target or self._bank_q != bank_target:
+            blend = 5.0 * dt
+            if self._pitch_q != pitch_target:
+                self._pitch_q = _ease_quat(self._pitch_q, pitch_target, blend)
+            if self._bank_q != bank_target:
+                # Bank returns to level faster than it enters a turn
+                bank_blend = blend * 1.5 if target_tilt == 0.0 else blend
+                self._bank_q = _ease_quat(self._bank_q, bank_target, bank_blend)
+            self.orientation = quat_multiply(self._pitch_q, self._bank_q)
+
+        # 3. Integrar velocidad, fricción y posición
+        # Nave en reposo y sin empuje: no hay nada que integrar
+        velocity = self.velocity
+        if not accel and velocity[0] * velocity[0] + velocity[2] * velocity[2] < 1e-6:
+            velocity[0] = velocity[2] = 0.0
+            return
+
+        _integrate_motion(self.position, self.velocity, self.rotation_y,
+                          accel, self.friction, dt,
+                          self._max_speed_allowed, self._max_speed_allowed_sq)
 
     def draw(self):
-        # Desactivar culling para la nave
-        glDisable(GL_CULL_FACE)
-
+        """
+        Dibuja la nave en su posición y orientación actuales.
+        Las caras traseras deben estar visibles: el estado que llama
+        desactiva GL_CULL_FACE para todo el grupo de objetos sin culling.
+        """
         glPushMatrix()
 
         # Trasladar a la posición actual
@@ -256,21 +324,8 @@ class Ship(Renderable):
         # Rotar según la dirección
         glRotatef(self.rotation_y, 0, 1, 0)
 
-        # Dibujar geometría
-        # Si estamos en boost, podríamos dibujar algo extra, pero cambiamos el color en _draw_geometry
-        # Como usamos display list, el cambio de color en _draw_geometry NO se reflejará dinámicamente
-        # a menos que recompiles la lista o no uses la lista para el color.
-        # Renderable.draw_list() llama a glCallList.
-        # Si queremos efectos dinámicos, mejor llamamos a _draw_geometry directamente o usamos glColor antes de callList
-        # PERO el color está DENTRO de la lista.
-        # Para que el color cambie, debemos sacar el glColor de la lista o no usar lista.
-        # Por simplicidad, llamaremos a _draw_geometry directamente aquí si queremos cambio de color,
-        # O simplemente aceptamos que el color no cambie.
-        # El usuario pidió "opción de boost", no necesariamente visuales complejos, pero el color ayuda.
-        # Vamos a llamar a _draw_geometry directamente para permitir el cambio de color dinámico.
+        # Se llama a _draw_geometry directamente (sin display list) para
+        # permitir cambios dinámicos como el color del boost.
         self._draw_geometry()
 
         glPopMatrix()
-
-        # Reactivar culling
-        glEnable(GL_CULL_FACE)
@@ -5,9 +5,40 @@ Defines a UFO/flying saucer spaceship built from primitive shapes.
 
 from OpenGL.GL import *
 from src.graphics.draw_utils import *
+from src.utils.math_helper import euler_to_matrix
 import math
 
 
+# Quantized sine table for the light animation (256 steps per turn is far
+# below what a blinking light can show)
+_SIN_LUT_SIZE = 256
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+_SIN_LUT = [math.sin(2 * math.pi * k / _SIN_LUT_SIZE) for k in range(_SIN_LUT_SIZE)]
+
+
+def _chase_light_colors(step, phase_steps, base, amplitude, color_off, color_delta):
+    """
+    Compute the RGB color of every light in a chase pattern.
+
+    Brightness is base + amplitude * sin(phase + offset), with the phase and
+    each offset given in sine table steps, interpolating from color_off by
+    color_delta (on - off). Pure numeric code with no GL calls, so the draw
+    loops only iterate the result.
+    """
+    off_r, off_g, off_b = color_off
+    d_r, d_g, d_b = color_delta
+    lut = _SIN_LUT
+    mask = _SIN_LUT_SIZE - 1
+    colors = []
+    append = colors.append
+    for offset in phase_steps:
+        brightness = base + amplitude * lut[(step + offset) & mask]
+        append((off_r + d_r * brightness,
+                off_g + d_g * brightness,
+                off_b + d_b * brightness))
+    return colors
+
+
 class ShipModel:
     COLORS = {
         'red': (1.0, 0.2, 0.2),
@@ -48,8 +79,10 @@ class ShipModel:
             rotation (list): Initial rotation [x, y, z]
             scale (float): Scale factor
         """
-        self.position = position or [0.0, 0.0, 0.0]
-        self.rotation = rotation or [0.0, 0.0, 0.0]
+        # Transform state lives in one list per component for the lifetime
+        # of the model; setters write in place so references stay valid
+        self.position = list(position) if position else [0.0, 0.0, 0.0]
+        self.rotation = list(rotation) if rotation else [0.0, 0.0, 0.0]
         self.scale = scale
         self.light_phase = 0.0
         self.animation_time = 0.0
@@ -72,10 +105,26 @@ class ShipModel:
         self.rim_light_radius = 0.2
         self.dome_rim_light_count = 12  # Reduced from 24 for performance
 
+        # Model matrix cached on (position, rotation, scale)
+        self._model_matrix = None
+        self._model_matrix_key = None
+
         # Display list for static geometry (compiled once)
         self._static_display_list = None
         self._is_compiled = False
 
+        # One propulsor compiled once, instanced by the static list
+        self._propulsor_list = None
+
+        # Transparent dome, compiled apart so it can be drawn last with blending
+        self._dome_list = None
+
+        # Consecutive display lists, one per light, with the light sphere
+        # already placed on the rim. Only the color is set per frame.
+        self._rim_lights_base = None
+        self._dome_lights_base = None
+        self._compiled_light_counts = (0, 0)
+
         # CINEMATIC COLORS - More vibrant and atmospheric
         # Metallic hull with blue-tinted steel
         self.saucer_main = (0.55, 0.6, 0.65)   # Lighter steel blue
@@ -96,7 +145,62 @@ class ShipModel:
         # Propulsors - bright red/orange glow
         self.propulsor_glow_color = (1.0, 0.2, 0.1)  # Bright red-orange
         self.propulsor_rim_color = (0.1, 0.1, 0.1)
-        self.propulsor_inner_color = (1.0, 0.4, 0.1)  # Bright orange core
+
+        # Per-light tables, derived colors and the cached light colors are
+        # (re)built by _build_tables() on every compile
+        self._build_tables()
+
+    def _build_tables(self):
+        """
+        Build the per-light tables and the colors derived from the
+        proportions and palette. Run again by each compile, so changes made
+        before invalidate() are picked up.
+        """
+        # Drawn slightly more opaque to reduce optical illusion
+        # (0.25 -> 0.35 for better depth perception)
+        self._dome_draw_color = (
+            self.dome_color[0], self.dome_color[1], self.dome_color[2], 0.35)
+
+        # Per-light tables (pure functions of the light index)
+        light_ring_radius = 3.6  # Distance from center (proportional)
+        self._rim_light_positions = []  # (x, z, yaw to face center)
+        for i in range(self.rim_light_count):
+            angle = (2 * math.pi * i) / self.rim_light_count
+            x = light_ring_radius * math.cos(angle)
+            z = light_ring_radius * math.sin(angle)
+            self._rim_light_positions.append(
+                (x, z, math.atan2(-z, -x) * 180 / math.pi))
+
+        torus_radius = 1.65  # Radius of the dome torus center (proportional)
+        self._dome_light_positions = []  # (x, z)
+        for i in range(self.dome_rim_light_count):
+            angle = (2 * math.pi * i) / self.dome_rim_light_count
+            self._dome_light_positions.append(
+                (torus_radius * math.cos(angle), torus_radius * math.sin(angle)))
+
+        # Propulsors evenly spaced on a ring below the hull
+        propulsor_ring_radius = 2.5  # Distance from center
+        propulsor_height = -0.25       # Height position (below hull)
+        self._propulsor_offsets = []
+        for i in range(self.propulsor_count):
+            angle = (2 * math.pi * i) / self.propulsor_count
+            self._propulsor_offsets.append(
+                (propulsor_ring_radius * math.cos(angle),
+                 propulsor_height,
+                 propulsor_ring_radius * math.sin(angle)))
+
+        # Chase-pattern phase offsets (in sine table steps) and on-off color span
+        self._rim_phase_steps = [
+            int(round(i * 0.3 * _SIN_LUT_SCALE)) for i in range(self.rim_light_count)]
+        self._dome_phase_steps = [
+            int(round(i * 0.2 * _SIN_LUT_SCALE)) for i in range(self.dome_rim_light_count)]
+        self._light_color_delta = tuple(
+            on - off for on, off in zip(self.light_color_on, self.light_color_off))
+
+        # Last computed light colors, keyed by the quantized phase step; the
+        # colors only change when the phase crosses a sine table step
+        self._rim_light_colors = (None, None)
+        self._dome_light_colors = (None, None)
 
     def update(self, delta_time):
         """
@@ -110,23 +214,90 @@ class ShipModel:
         # Animate rim lights (rotating pattern)
         self.light_phase += delta_time * 2.0  # Speed of light rotation
 
+    def invalidate(self):
+        """
+        Mark the compiled geometry as stale.
+
+        The next draw() recompiles every display list, freeing the old ones
+        first and rebuilding the per-light tables and derived colors. Call
+        after changing any proportion, color or light count baked into them.
+        """
+        self._is_compiled = False
+
     def _compile_static_geometry(self):
-        """Compile static UFO geometry into a display list for performance."""
+        """
+        Compile static UFO geometry into display lists for performance.
+
+        Safe to call again: lists from a previous compile are deleted first.
+        """
+        self._build_tables()
+
         if self._static_display_list is not None:
             glDeleteLists(self._static_display_list, 1)
+        if self._propulsor_list is not None:
+            glDeleteLists(self._propulsor_list, 1)
+        if self._dome_list is not None:
+            glDeleteLists(self._dome_list, 1)
+
+        # Sub-list first: lists can be called, not created, while compiling
+        self._propulsor_list = glGenLists(1)
+        glNewList(self._propulsor_list, GL_COMPILE)
+        self._draw_propulsor()
+        glEndList()
 
         self._static_display_list = glGenLists(1)
         glNewList(self._static_display_list, GL_COMPILE)
 
         # Static components (no animation)
-        self._draw_bottom_hull()
+        self._draw_hull()
         self._draw_propulsors()
-        self._draw_main_saucer()
-        self._draw_rim_details()
+        self._draw_dome_rim()
+
+        glEndList()
 
+        self._dome_list = glGenLists(1)
+        glNewList(self._dome_list, GL_COMPILE)
+        self._draw_dome_geometry()
         glEndList()
+
+        self._compile_light_lists()
         self._is_compiled = True
 
+    def _compile_light_lists(self):
+        """Compile one positioned sphere list per rim and dome light."""
+        # Free with the counts the lists were compiled with, not the current ones
+        rim_count, dome_count = self._compiled_light_counts
+        if self._rim_lights_base is not None:
+            glDeleteLists(self._rim_lights_base, rim_count)
+        if self._dome_lights_base is not None:
+            glDeleteLists(self._dome_lights_base, dome_count)
+        self._compiled_light_counts = (
+            len(self._rim_light_positions), len(self._dome_light_positions))
+
+        light_height = 0.0         # Height position (at rim level)
+
+        self._rim_lights_base = glGenLists(len(self._rim_light_positions))
+        for i, (x, z, yaw) in enumerate(self._rim_light_positions):
+            glNewList(self._rim_lights_base + i, GL_COMPILE)
+            glPushMatrix()
+            glTranslatef(x, light_height, z)
+            # Rotate around Y to face center, then tilt down 45 degrees
+            glRotatef(yaw, 0, 1, 0)
+            glRotatef(45, 1, 0, 0)
+            draw_sphere(radius=self.rim_light_radius, slices=8, stacks=6)
+            glPopMatrix()
+            glEndList()
+
+        self._dome_lights_base = glGenLists(len(self._dome_light_positions))
+        for i, (x, z) in enumerate(self._dome_light_positions):
+            glNewList(self._dome_lights_base + i, GL_COMPILE)
+            glPushMatrix()
+            # Position on the torus rim, at dome rim height
+            glTranslatef(x, 0.3, z)
+            draw_sphere(radius=0.1, slices=6, stacks=4)
+            glPopMatrix()
+            glEndList()
+
     def draw(self):
         """Draw the complete UFO model."""
         # Compile static geometry on first draw
@@ -135,14 +306,9 @@ class ShipModel:
 
         glPushMatrix()
 
-        # Apply model transformation
-        glTranslatef(*self.position)
-        glRotatef(self.rotation[1], 0, 1, 0)  # Yaw
-        glRotatef(self.rotation[0], 1, 0, 0)  # Pitch
-        glRotatef(self.rotation[2], 0, 0, 1)  # Roll
-        glScalef(self.scale, self.scale, self.scale)
-
-        glTranslate(0, 1.3, 0)
+        # Apply model transformation (translate, yaw, pitch, roll, scale,
+        # lift) as one matrix
+        glMultMatrixf(self._get_model_matrix())
 
         # Draw static geometry from display list (fast)
         if self._static_display_list is not None:
@@ -150,114 +316,93 @@ class ShipModel:
 
         # Draw animated components (must be drawn each frame)
         self._draw_rim_lights()
-        self._draw_dome()  # Transparent dome last
         self._draw_dome_rim_lights()
+        self._draw_dome()  # Transparent dome last, single blend pass
 
         glPopMatrix()
 
-    def _draw_main_saucer(self):
-        """Draw the main flying saucer disc using cylinders."""
-        glPushMatrix()
+    def _get_model_matrix(self):
+        """Return the column-major model matrix, rebuilt only when the transform changes."""
+        key = (tuple(self.position), tuple(self.rotation), self.scale)
+        if key != self._model_matrix_key:
+            self._model_matrix = euler_to_matrix(
+                self.position, self.rotation, self.scale, pivot=(0.0, 1.3, 0.0))
+            self._model_matrix_key = key
+        return self._model_matrix
 
-        # Main disc body - wide at middle, tapered at edges
-        # Bottom half of disc
+    def _draw_hull(self):
+        """
+        Draw bottom hull, main saucer disc halves and rim band as one
+        surface of revolution. Only the visible outline of the stacked
+        parts is swept, so caps buried inside neighbouring parts are skipped.
+        """
+        half_h = self.saucer_height / 2  # 0.15
+
+        # Bottom hull: inverted frustum 2.6 -> 0.8 from y=-0.15 down to y=-0.85
+        hull_top, hull_bottom = -0.5 + 0.35, -0.5 - 0.35
+        # Lower disc half: 2.6 -> 3.5, y in [-0.225, -0.075]
+        low_bottom, low_top = -half_h - half_h / 2, -half_h + half_h / 2
+        # Rim band: radius 3.6, y in [-0.075, 0.075]
+        band = 0.075
+        # Upper disc half: 3.5 -> 2.6, y in [0.05, 0.25]
+        up_h = self.saucer_height / 1.5
+        up_bottom, up_top = 0.15 - up_h / 2, 0.15 + up_h / 2
+
+        # Where the hull side disappears into the lower disc, and where the
+        # upper disc side emerges from the rim band
+        hull_r = 0.8 + (2.6 - 0.8) * (low_bottom - hull_bottom) / (hull_top - hull_bottom)
+        up_r = 3.5 + (2.6 - 3.5) * (band - up_bottom) / (up_top - up_bottom)
+
+        profile = [
+            (0.0, hull_bottom), (0.8, hull_bottom),  # hull bottom cap
+            (hull_r, low_bottom),                    # hull side
+            (2.6, low_bottom),                       # lower disc underside ring
+            (3.5, low_top),                          # lower disc side
+            (3.6, -band),                            # rim band underside ring
+            (3.6, band),                             # rim band side
+            (up_r, band),                            # rim band top ring
+            (2.6, up_top),                           # upper disc side
+            (0.0, up_top),                           # upper disc top cap
+        ]
+        colors = [
+            self.bottom_color, self.bottom_color,
+            self.saucer_main, self.saucer_main,
+            self.saucer_dark, self.saucer_dark, self.saucer_dark,
+            self.saucer_accent, self.saucer_accent,
+        ]
+        draw_lathe(profile, slices=32, colors=colors)
+
+    def _draw_propulsor(self):
+        """Draw a single propulsor (torus rim + glowing core) at the origin."""
+        # Draw torus rim (dark red)
         glPushMatrix()
-        glTranslatef(0, -self.saucer_height / 2, 0)
-        draw_cylinder(
-            base_radius=2.6,      # Wide at bottom (proportional to 3.5)
-            top_radius=3.5,       # Wider at middle
-            height=self.saucer_height / 2,
-            slices=32,
-            stacks=1,
-            color=self.saucer_main
+        glRotatef(90, 1, 0, 0)
+        draw_torus(
+            inner_radius=0.15,
+            outer_radius=self.propulsor_radius,
+            color=self.propulsor_rim_color
         )
         glPopMatrix()
 
-        # Top half of disc
-        glPushMatrix()
-        glTranslatef(0, 0.15, 0)
-        draw_cylinder(
-            base_radius=3.5,      # Wide at middle
-            top_radius=2.6,       # Tapered at top (proportional)
-            height=self.saucer_height / 1.5,
-            slices=32,
-            stacks=1,
-            color=self.saucer_accent
+        # Draw glowing propulsor core (bright red-orange sphere). It is opaque,
+        # so no inner core sphere is drawn inside it: it could never be seen.
+        draw_sphere(
+            radius=self.propulsor_radius * 0.7,
+            slices=16,
+            stacks=16,
+            color=self.propulsor_glow_color
         )
-        glPopMatrix()
-
-        glPopMatrix()
-
-    def _draw_bottom_hull(self):
-        """Draw the bottom dome/hull of the UFO."""
-        glPushMatrix()
-
-        # Position at bottom of saucer
-        glTranslatef(0, -0.5, 0)
-
-        # Draw inverted hemisphere for bottom
-        glPushMatrix()
-        glRotatef(180, 1, 0, 0)  # Flip upside down
-        glColor3f(*self.bottom_color)
-        draw_cylinder(2.6, 0.8, 0.7)  # Proportional to new size
-        glPopMatrix()
-
-        glPopMatrix()
 
     def _draw_propulsors(self):
-        """Draw red propulsors with torus rims on the bottom of the UFO."""
-        glPushMatrix()
-
-        propulsor_ring_radius = 2.5  # Distance from center
-        propulsor_height = -0.25       # Height position (below hull)
-
-        # Draw propulsors in a triangular pattern (3 propulsors)
-        for i in range(self.propulsor_count):
-            # Calculate angle for this propulsor (120 degrees apart)
-            angle = (2 * math.pi * i) / self.propulsor_count
-
-            glPushMatrix()
-
-            # Position the propulsor
-            x = propulsor_ring_radius * math.cos(angle)
-            z = propulsor_ring_radius * math.sin(angle)
-            glTranslatef(x, propulsor_height, z)
-
-            # Draw torus rim (dark red)
+        """Place the shared propulsor display list around the bottom of the UFO."""
+        for x, y, z in self._propulsor_offsets:
             glPushMatrix()
-            glRotatef(90, 1, 0, 0)
-            draw_torus(
-                inner_radius=0.15,
-                outer_radius=self.propulsor_radius,
-                color=self.propulsor_rim_color
-            )
+            glTranslatef(x, y, z)
+            glCallList(self._propulsor_list)
             glPopMatrix()
 
-            # Draw glowing propulsor core (bright red-orange sphere)
-            draw_sphere(
-                radius=self.propulsor_radius * 0.7,
-                slices=16,
-                stacks=16,
-                color=self.propulsor_glow_color
-            )
-
-            # Draw bright inner core (orange glow)
-            draw_sphere(
-                radius=self.propulsor_radius * 0.4,
-                slices=12,
-                stacks=12,
-                color=self.propulsor_inner_color
-            )
-
-            glPopMatrix()
-
-        glPopMatrix()
-
-    def _draw_dome(self):
-        """Draw the transparent dome/cockpit on top."""
-        glPushMatrix()
-
-        # Dome rim
+    def _draw_dome_rim(self):
+        """Draw the opaque torus rim around the base of the dome."""
         glPushMatrix()
         glTranslatef(0, 0.3, 0)
         glRotatef(90, 1, 0, 0)
@@ -268,154 +413,72 @@ class ShipModel:
         )
         glPopMatrix()
 
+    def _draw_dome_geometry(self):
+        """Draw the dome hemisphere (compiled; blending is set by _draw_dome)."""
+        glPushMatrix()
+
         # Position dome on top of saucer
         glTranslatef(0, self.saucer_height / 2, 0)
 
-        # Enable transparency for the dome
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        # Keep depth write enabled so dome properly occludes objects behind it
-        glDepthMask(GL_TRUE)
-
         # Draw transparent hemisphere dome with increased opacity
-        # Using slightly more opaque dome to reduce optical illusion
-        dome_color_adjusted = (
-            self.dome_color[0],
-            self.dome_color[1],
-            self.dome_color[2],
-            0.35  # Increased from 0.25 to 0.35 for better depth perception
-        )
-
         draw_half_sphere(
             radius=self.dome_radius,
             slices=32,
             stacks=16,
             upper=True,
             closed=False,  # No bottom cap (open to saucer)
-            color=dome_color_adjusted
+            color=self._dome_draw_color
         )
 
-        # Restore normal rendering
-        glDisable(GL_BLEND)
-
         glPopMatrix()
 
-    def _draw_rim_details(self):
-        """Draw metallic rim detail around the edge."""
-        glPushMatrix()
+    def _draw_dome(self):
+        """Draw the transparent dome/cockpit, after every opaque part."""
+        # Enable transparency for the dome. Depth writes stay enabled so the
+        # dome properly occludes objects behind it.
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
-        # Rim band around the widest part
-        glTranslatef(0, 0, 0)
-        draw_cylinder(
-            # Slightly larger than main disc (proportional)
-            base_radius=3.6,
-            top_radius=3.6,
-            height=0.15,          # Thin band
-            slices=32,
-            stacks=1,
-            color=self.saucer_dark
-        )
+        glCallList(self._dome_list)
 
-        glPopMatrix()
+        # Restore normal rendering
+        glDisable(GL_BLEND)
 
     def _draw_rim_lights(self):
-        """Draw repeating lights around the rim using a for loop."""
-        glPushMatrix()
-
-        light_ring_radius = 3.6  # Distance from center (proportional)
-        light_height = 0.0         # Height position (at rim level)
-
-        # Draw lights in a circle around the rim
-        for i in range(self.rim_light_count):
-            # Calculate angle for this light
-            angle = (2 * math.pi * i) / self.rim_light_count
-
-            # Animate lights (chase pattern)
-            light_offset = (self.light_phase + i * 0.3) % (2 * math.pi)
-            brightness = 0.5 + 0.5 * math.sin(light_offset)
-
-            # Interpolate between on and off colors
-            light_color = (
-                self.light_color_off[0] + (self.light_color_on[0] -
-                                           self.light_color_off[0]) * brightness,
-                self.light_color_off[1] + (self.light_color_on[1] -
-                                           self.light_color_off[1]) * brightness,
-                self.light_color_off[2] + (self.light_color_on[2] -
-                                           self.light_color_off[2]) * brightness
-            )
-
-            glPushMatrix()
-
-            # Position at the rim
-            x = light_ring_radius * math.cos(angle)
-            z = light_ring_radius * math.sin(angle)
-            glTranslatef(x, light_height, z)
-
-            # Rotate to lean toward center (point inward)
-            # Calculate angle to center in XZ plane
-            angle_to_center = math.atan2(-z, -x) * 180 / math.pi
-            # Rotate around Y to face center
-            glRotatef(angle_to_center, 0, 1, 0)
-            glRotatef(45, 1, 0, 0)  # Tilt down 45 degrees toward center
-
-            # Draw light sphere - OPTIMIZED: reduced polygon count
-            draw_sphere(
-                radius=self.rim_light_radius,
-                slices=8,
-                stacks=6,
-                color=light_color
-            )
-
-            glPopMatrix()
-
-        glPopMatrix()
+        """Draw the chasing lights around the rim from their display lists."""
+        # Specular/shininess once for all lights; each list only holds geometry
+        set_material_color(self.light_color_on)
+
+        step = int(self.light_phase * _SIN_LUT_SCALE)
+        cached_step, colors = self._rim_light_colors
+        if step != cached_step:
+            colors = _chase_light_colors(
+                step, self._rim_phase_steps, 0.5, 0.5,
+                self.light_color_off, self._light_color_delta)
+            self._rim_light_colors = (step, colors)
+        base = self._rim_lights_base
+        color3f, call_list = glColor3f, glCallList
+        for i, color in enumerate(colors):
+            color3f(*color)
+            call_list(base + i)
 
     def _draw_dome_rim_lights(self):
-        """Draw lights around the dome torus rim."""
-        glPushMatrix()
-
-        # Position at dome rim height
-        glTranslatef(0, 0.3, 0)
-
-        torus_radius = 1.65  # Radius of the torus center (proportional)
-
-        # Draw more lights around the dome rim
-        for i in range(self.dome_rim_light_count):
-            # Calculate angle for this light
-            angle = (2 * math.pi * i) / self.dome_rim_light_count
-
-            # Animate with different phase than bottom lights
-            light_offset = (self.light_phase * 1.5 + i * 0.2) % (2 * math.pi)
-            brightness = 0.6 + 0.4 * math.sin(light_offset)
-
-            # Interpolate colors
-            light_color = (
-                self.light_color_off[0] + (self.light_color_on[0] -
-                                           self.light_color_off[0]) * brightness,
-                self.light_color_off[1] + (self.light_color_on[1] -
-                                           self.light_color_off[1]) * brightness,
-                self.light_color_off[2] + (self.light_color_on[2] -
-                                           self.light_color_off[2]) * brightness
-            )
-
-            glPushMatrix()
-
-            # Position on the torus rim
-            x = torus_radius * math.cos(angle)
-            z = torus_radius * math.sin(angle)
-            glTranslatef(x, 0, z)
-
-            # Draw small light - OPTIMIZED: reduced polygon count
-            draw_sphere(
-                radius=0.1,
-                slices=6,
-                stacks=4,
-                color=light_color
-            )
-
-            glPopMatrix()
-
-        glPopMatrix()
+        """Draw lights around the dome torus rim from their display lists."""
+        set_material_color(self.light_color_on)
+
+        # Animate with different phase than bottom lights
+        step = int(self.light_phase * 1.5 * _SIN_LUT_SCALE)
+        cached_step, colors = self._dome_light_colors
+        if step != cached_step:
+            colors = _chase_light_colors(
+                step, self._dome_phase_steps, 0.6, 0.4,
+                self.light_color_off, self._light_color_delta)
+            self._dome_light_colors = (step, colors)
+        base = self._dome_lights_base
+        color3f, call_list = glColor3f, glCallList
+        for i, color in enumerate(colors):
+            color3f(*color)
+            call_list(base + i)
 
     def set_position(self, x, y, z):
         """
@@ -424,7 +487,7 @@ class ShipModel:
         Args:
             x, y, z (float): New position
         """
-        self.position = [x, y, z]
+        self.position[:] = (x, y, z)
 
     def set_rotation(self, x, y, z):
         """
@@ -433,7 +496,7 @@ class ShipModel:
         Args:
             x, y, z (float): New rotation in degrees
         """
-        self.rotation = [x, y, z]
+        self.rotation[:] = (x, y, z)
 
     def move(self, dx, dy, dz):
         """
@@ -16,16 +16,54 @@ NAVE_BASE_Y_OFFSET = 1.21
 _static_display_list = None
 _is_compiled = False
 
+# Display lists for the rigid leg meshes {es_derecha: list_id}.
+# Legs are animated by their anchor rotation only, so the mesh itself is static.
+_pata_display_lists = {}
+
+# Anclajes de las patas: (x, y, z, es_derecha)
+PATA_ANCLAJES = [(0.9, -0.2, 0.5, True), (-0.9, -0.2, 0.5, False),
+                 (1.0, -0.1, -0.5, True), (-1.0, -0.1, -0.5, False)]
+
+# El balanceo de patas se cuantiza en buckets; cada bucket es una display
+# list con las cuatro patas ya giradas. Pasos de ~0.4° son imperceptibles.
+BALANCEO_MAX = 6.0
+BALANCEO_BUCKETS = 33
+_BALANCEO_STEP = 2 * BALANCEO_MAX / (BALANCEO_BUCKETS - 1)
+_patas_buckets_base = None
+
+
+# Último brillo emitido dentro de la display list que se está compilando
+_ultimo_brillo = None
+
+
+def _iniciar_material():
+    """Fija el especular una sola vez al inicio de cada display list."""
+    global _ultimo_brillo
+    glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, (0.5, 0.5, 0.5, 1.0))
+    _ultimo_brillo = None
+
+
+def _set_color(color, shininess=32.0):
+    """
+    Color por glColor3f (GL_COLOR_MATERIAL) y brillo solo cuando cambia,
+    en lugar de un set_material_color completo por pieza.
+    """
+    global _ultimo_brillo
+    glColor3f(*color)
+    if shininess != _ultimo_brillo:
+        glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, shininess)
+        _ultimo_brillo = shininess
+
 
 def _dibujar_cuerpo_base():
 
-    du.set_material_color(COLOR_CHASIS, shininess=30.0)
+    _set_color(COLOR_CHASIS, shininess=30.0)
     du.glPushMatrix()
     du.glScalef(1.4, 0.9, 1.3)
     du.draw_sphere(radius=1.0)
     du.glPopMatrix()
 
-    du.set_material_color(COLOR_BORDE_OJOS)
+    _set_color(COLOR_BORDE_OJOS)
     du.glPushMatrix()
     du.glScalef(1.42, 0.92, 0.1)
     du.draw_sphere(radius=1.0)
@@ -33,7 +71,7 @@ def _dibujar_cuerpo_base():
 
 
 def _dibujar_alitas():
-    du.set_material_color(COLOR_ALAS, shininess=50.0)
+    _set_color(COLOR_ALAS, shininess=50.0)
     # Ala Izquierda
     du.glPushMatrix()
     du.glTranslatef(-0.5, 0.6, 0.3)
@@ -62,7 +100,7 @@ def _dibujar_ojos():
         du.glRotatef(rotaciones[i], 0, 1, 0)
 
         # 1. El Marco
-        du.set_material_color(COLOR_BORDE_OJOS)
+        _set_color(COLOR_BORDE_OJOS)
         du.glPushMatrix()
         du.glScalef(0.65, 0.65, 0.45)
         du.draw_sphere(radius=1.0)
@@ -81,16 +119,14 @@ def _dibujar_antenas():
         du.glRotatef(angulo, 0, 0, 1)
         du.glRotatef(20, 1, 0, 0)
 
-        du.set_material_color(COLOR_DETALLES, shininess=40.0)
+        _set_color(COLOR_DETALLES, shininess=40.0)
         du.draw_sphere(0.08)
-
-        du.set_material_color(COLOR_DETALLES, shininess=40.0)
         du.draw_cylinder(base_radius=0.03, top_radius=0.02, height=0.5)
 
         # Punta
         du.glPushMatrix()
         du.glTranslatef(0.0, 0.25, 0.0)
-        du.set_material_color(COLOR_PROPULSOR, shininess=80.0)
+        _set_color(COLOR_PROPULSOR, shininess=80.0)
         du.draw_sphere(0.05)
         du.glPopMatrix()
 
@@ -107,18 +143,18 @@ def _dibujar_propulsores():
         du.glRotatef(180, 0, 1, 0)
 
         # Carcasa
-        du.set_material_color(COLOR_BORDE_OJOS, shininess=20.0)
+        _set_color(COLOR_BORDE_OJOS, shininess=20.0)
         du.draw_cylinder(base_radius=0.28, top_radius=0.32, height=0.5)
 
         # Anillo
         du.glPushMatrix()
         du.glTranslatef(0.0, 0.5, 0.0)
-        du.set_material_color(COLOR_DETALLES, shininess=60.0)
+        _set_color(COLOR_DETALLES, shininess=60.0)
         du.draw_torus(inner_radius=0.02, outer_radius=0.32, sides=8, rings=16)
         du.glPopMatrix()
 
         # Fuego
-        du.set_material_color(COLOR_PROPULSOR, shininess=80.0)
+        _set_color(COLOR_PROPULSOR, shininess=80.0)
         du.glPushMatrix()
         du.glTranslatef(0.0, 0.1, 0.0)
         du.draw_cone(base_radius=0.18, height=0.4)
@@ -133,9 +169,9 @@ def _dibujar_pata_detallada(lado_derecho=True):
         du.glScalef(-1.0, 1.0, 1.0)
 
     # Hombro
-    du.set_material_color(COLOR_DETALLES, shininess=50.0)
+    _set_color(COLOR_DETALLES, shininess=50.0)
     du.draw_sphere(0.22)
-    du.set_material_color(COLOR_PATAS, shininess=20.0)
+    _set_color(COLOR_PATAS, shininess=20.0)
 
     # Muslo
     du.glPushMatrix()
@@ -149,7 +185,7 @@ def _dibujar_pata_detallada(lado_derecho=True):
 
     # Rodilla
     du.glTranslatef(0.0, -0.6, 0.0)
-    du.set_material_color(COLOR_DETALLES, shininess=50.0)
+    _set_color(COLOR_DETALLES, shininess=50.0)
     du.draw_sphere(0.16)
 
     # Pantorrilla
@@ -161,7 +197,7 @@ def _dibujar_pata_detallada(lado_derecho=True):
 
     # Pie
     du.glTranslatef(0.0, -0.5, 0.0)
-    du.set_material_color(COLOR_PATAS, shininess=20.0)
+    _set_color(COLOR_PATAS, shininess=20.0)
     du.glScalef(1.3, 0.4, 1.5)
     du.draw_sphere(0.15)
 
@@ -182,6 +218,7 @@ def _compile_static_geometry():
 
     _static_display_list = glGenLists(1)
     glNewList(_static_display_list, GL_COMPILE)
+    _iniciar_material()
 
     # All static components
     _dibujar_cuerpo_base()
@@ -191,9 +228,43 @@ def _compile_static_geometry():
     _dibujar_propulsores()
 
     glEndList()
+
+    for es_derecha in (True, False):
+        if es_derecha in _pata_display_lists:
+            glDeleteLists(_pata_display_lists[es_derecha], 1)
+        list_id = glGenLists(1)
+        glNewList(list_id, GL_COMPILE)
+        _iniciar_material()
+        _dibujar_pata_detallada(es_derecha)
+        glEndList()
+        _pata_display_lists[es_derecha] = list_id
+
+    _compile_patas_buckets()
+
     _is_compiled = True
 
 
+def _compile_patas_buckets():
+    """Compila una display list con las cuatro patas por cada ángulo cuantizado."""
+    global _patas_buckets_base
+
+    if _patas_buckets_base is not None:
+        glDeleteLists(_patas_buckets_base, BALANCEO_BUCKETS)
+
+    _patas_buckets_base = glGenLists(BALANCEO_BUCKETS)
+    for bucket in range(BALANCEO_BUCKETS):
+        balanceo_z = -BALANCEO_MAX + bucket * _BALANCEO_STEP
+
+        glNewList(_patas_buckets_base + bucket, GL_COMPILE)
+        for x, y, z, es_derecha in PATA_ANCLAJES:
+            du.glPushMatrix()
+            du.glTranslatef(x, y, z)
+            du.glRotatef(balanceo_z if es_derecha else -balanceo_z, 0, 0, 1)
+            glCallList(_pata_display_lists[es_derecha])
+            du.glPopMatrix()
+        glEndList()
+
+
 def dibujar_nave(anim_state=None):
     """
     Dibuja la nave completa.
@@ -220,17 +291,10 @@ def dibujar_nave(anim_state=None):
     if _static_display_list is not None:
         glCallList(_static_display_list)
 
-    # Animated parts: legs with movement
+    # Animated parts: legs swing around their anchors (one bucketed list)
     balanceo_z = anim_state["balanceo_pata_z"] if anim_state and "balanceo_pata_z" in anim_state else 0.0
-
-    pata_anclajes = [(0.9, -0.2, 0.5, True), (-0.9, -0.2, 0.5, False),
-                     (1.0, -0.1, -0.5, True), (-1.0, -0.1, -0.5, False)]
-
-    for x, y, z, es_derecha in pata_anclajes:
-        du.glPushMatrix()
-        du.glTranslatef(x, y, z)
-        du.glRotatef(balanceo_z if es_derecha else -balanceo_z, 0, 0, 1)
-        _dibujar_pata_detallada(es_derecha)
-        du.glPopMatrix()
+    balanceo_z = max(-BALANCEO_MAX, min(BALANCEO_MAX, balanceo_z))
+    bucket = int(round((balanceo_z + BALANCEO_MAX) / _BALANCEO_STEP))
+    glCallList(_patas_buckets_base + bucket)
 
     du.glPopMatrix()
@@ -10,8 +10,6 @@ _is_compiled = False
 
 
 def draw_fuselaje():
-    glEnable(GL_DEPTH_TEST)
-
     glColor3f(0.3, 0.3, 0.4)
     glPushMatrix()
     glTranslatef(0, 0, 0)
@@ -32,8 +30,6 @@ def draw_fuselaje():
 
 
 def draw_alas():
-    glEnable(GL_DEPTH_TEST)
-
     glColor3f(0.4, 0.4, 0.5)
     glPushMatrix()
     glTranslatef(0, -0.2, 0)
@@ -69,8 +65,6 @@ def draw_alas():
 
 
 def draw_propulsores():
-    glEnable(GL_DEPTH_TEST)
-
     glColor3f(0.2, 0.2, 0.3)
     glPushMatrix()
     glTranslatef(0, -0.1, -2.2)
@@ -93,8 +87,6 @@ def draw_propulsores():
 
 
 def draw_armamento():
-    glEnable(GL_DEPTH_TEST)
-
     glColor3f(0.2, 0.2, 0.2)
     glPushMatrix()
     glTranslatef(-0.5, 0.1, 1.8)
@@ -132,6 +124,9 @@ def _compile_static_geometry():
     _static_display_list = glGenLists(1)
     glNewList(_static_display_list, GL_COMPILE)
 
+    # Once for the whole model (each part used to enable it again)
+    glEnable(GL_DEPTH_TEST)
+
     draw_fuselaje()
     draw_alas()
     draw_propulsores()
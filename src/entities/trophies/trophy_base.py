@@ -5,6 +5,89 @@ Each planet has a unique trophy that reflects its characteristics.
 import math
 from OpenGL.GL import *
 from OpenGL.GLU import *
+from OpenGL.GLUT import glutSolidTorus
+from src.utils.math_helper import translate_rotate_matrix
+
+# Shared GLU quadric (a stateless parameter object), created lazily because
+# a GL context may not exist at import time
+_quadric = None
+
+
+def _get_quadric():
+    """Return the module-wide smooth-normal quadric."""
+    global _quadric
+    if _quadric is None:
+        _quadric = gluNewQuadric()
+        gluQuadricNormals(_quadric, GLU_SMOOTH)
+    return _quadric
+
+
+# Composite translate + rotate matrices, keyed by their arguments
+_transform_cache = {}
+
+
+def _translate_rotate(tx, ty, tz, angle, axis):
+    """Cached column-major matrix for glTranslatef(tx, ty, tz) · glRotatef(angle, *axis)."""
+    key = (tx, ty, tz, angle, axis)
+    matrix = _transform_cache.get(key)
+    if matrix is None:
+        matrix = translate_rotate_matrix((tx, ty, tz), angle, axis)
+        _transform_cache[key] = matrix
+    return matrix
+
+
+def _float_buffer(values):
+    """Contiguous ctypes GLfloat array holding `values`."""
+    return (GLfloat * len(values))(*values)
+
+
+def _unit_circle(count, step_deg, offset_deg=0.0):
+    """(cos, sin) pairs for `count` angles offset_deg + i * step_deg."""
+    return tuple((math.cos(math.radians(offset_deg + i * step_deg)),
+                  math.sin(math.radians(offset_deg + i * step_deg)))
+                 for i in range(count))
+
+
+# Mercury cup handles as (start, end) tube segments: the horizontal bar and
+# the two vertical parts
+_MERCURY_HANDLE_BAR = (((-0.3, 0.17, 0), (0.3, 0.17, 0)),)
+_MERCURY_HANDLE_UPRIGHTS = tuple(
+    ((side * 0.26, 0.18, 0), (side * 0.26, 0.30, 0)) for side in (-1, 1))
+
+# Angle tables for the small radial patterns used by the trophies
+_CIRCLE_6 = _unit_circle(7, 60)          # hexagons (closing vertex included)
+_CIRCLE_5 = _unit_circle(5, 72)
+_CIRCLE_4_DIAGONAL = _unit_circle(4, 90, 45)
+_SUN_RAYS = _unit_circle(12, -30)
+
+# Darkened/tinted color variants keyed by (color, factors), built on first use
+_shades = {}
+
+
+def _shade(color, factors):
+    """Return color scaled by one factor or a per-channel (r, g, b) triple."""
+    key = (color, factors)
+    shaded = _shades.get(key)
+    if shaded is None:
+        if not isinstance(factors, tuple):
+            factors = (factors, factors, factors)
+        shaded = tuple(c * k for c, k in zip(color, factors))
+        _shades[key] = shaded
+    return shaded
+
+
+# Earth continent patches, relative to the globe center
+_EARTH_CONTINENTS = (
+    (0.15, 0.1, 0.1),    # North America area
+    (-0.1, 0.05, 0.15),  # Europe area
+    (0.05, -0.1, 0.15),  # Africa area
+    (-0.15, 0.0, -0.1),  # Asia area
+    (0.1, -0.12, -0.1),  # South America area
+)
+
+# Small rocks around the Mars base
+_MARS_ROCKS = tuple(
+    (0.15 * cos_a, -0.1, 0.15 * sin_a) for cos_a, sin_a in _unit_circle(5, 72, 15))
 
 
 class Trophy:
@@ -38,84 +121,204 @@ class Trophy:
         "Sun": (1.0, 1.0, 0.4)
     }
 
+    # Compiled display lists shared by every trophy of the same planet
+    # (the geometry only depends on planet_name)
+    _display_lists = {}
+
+    # Reduced-tessellation variants of _display_lists, used at small scales
+    _low_detail_lists = {}
+
+    # Blended parts compiled apart from the opaque list, so a renderer can
+    # draw every opaque trophy first and toggle GL_BLEND once for the rest
+    _transparent_lists = {}
+
+    # Sub-lists reused inside several trophy lists, keyed by part name
+    _shared_lists = {}
+
+    # Tessellation scale for the larger curved parts. Trophies are only seen
+    # small on screen, so two thirds of the original segment counts are
+    # indistinguishable; counts of 12 or less are left alone.
+    _LOD = 2.0 / 3.0
+
+    # (factor, floor) applied by _lod while compiling. The low-detail lists
+    # are drawn when the caller asks for them (small trophies in a row).
+    _detail = (_LOD, 12)
+    _LOW_DETAIL = (0.4, 8)
+
+    # Coarser stand-ins for the shared sub-lists inside the low-detail lists
+    _LOW_SHARED = {
+        "lower_stem": "lower_stem_low",
+        "sphere_10": "sphere_8",
+        "sphere_12": "sphere_8",
+        "disk_12": "disk_8",
+        "cone_8": "cone_8_low",
+    }
+
+    # Precomputed flat vertex arrays keyed by (shape, *parameters)
+    _vertex_arrays = {}
+
     def __init__(self, planet_name):
         self.planet_name = planet_name
-        self.display_list = None
+        self.display_list = Trophy._display_lists.get(planet_name)
+        self.display_list_low = Trophy._low_detail_lists.get(planet_name)
+        self.display_list_transparent = Trophy._transparent_lists.get(planet_name)
         self.rotation = 0.0
-        self._create_display_list()
+        # Set by render(), cleared by TrophyRenderer.update_all: only trophies
+        # drawn since the last update keep spinning
+        self.visible = False
+        if self.display_list is None:
+            self._create_display_list()
+
+    def _lod(self, segments):
+        """Scale a slice/stack count by the current detail factor, never below its floor."""
+        factor, floor = self._detail
+        if segments <= floor:
+            return segments
+        return max(floor, int(round(segments * factor)))
+
+    def _shared(self, name):
+        """Shared sub-list `name`, or its coarser stand-in while compiling low detail."""
+        if self._detail is Trophy._LOW_DETAIL:
+            name = Trophy._LOW_SHARED.get(name, name)
+        return Trophy._shared_lists[name]
+
+    @classmethod
+    def _compile_shared_lists(cls):
+        """
+        Compile sub-geometry shared by several trophies. Must run before the
+        trophy list is opened, since display lists cannot be nested while compiling.
+        """
+        if cls._shared_lists:
+            return
+
+        quadric = _get_quadric()
+        parts = {
+            "lower_stem": lambda: cls._draw_lower_stem(12),
+            "lower_stem_low": lambda: cls._draw_lower_stem(8),
+            # Unit primitives for repeated decorations, placed with
+            # glTranslatef/glScalef (GL_NORMALIZE keeps the lighting right)
+            "sphere_6": lambda: gluSphere(quadric, 1.0, 6, 6),
+            "sphere_8": lambda: gluSphere(quadric, 1.0, 8, 8),
+            "sphere_10": lambda: gluSphere(quadric, 1.0, 10, 10),
+            "sphere_12": lambda: gluSphere(quadric, 1.0, 12, 12),
+            "disk_8": lambda: gluDisk(quadric, 0.0, 1.0, 8, 1),
+            "disk_12": lambda: gluDisk(quadric, 0.0, 1.0, 12, 1),
+            "cone_6": lambda: gluCylinder(quadric, 1.0, 0.0, 1.0, 6, 1),
+            "cone_8": lambda: gluCylinder(quadric, 1.0, 0.0, 1.0, 8, 3),
+            "cone_8_low": lambda: gluCylinder(quadric, 1.0, 0.0, 1.0, 8, 1),
+        }
+        for name, emit in parts.items():
+            list_id = glGenLists(1)
+            glNewList(list_id, GL_COMPILE)
+            emit()
+            glEndList()
+            cls._shared_lists[name] = list_id
+
+    @staticmethod
+    def _draw_lower_stem(slices):
+        """Flared stem joining the cup to the pedestal."""
+        glPushMatrix()
+        glMultMatrixf(_translate_rotate(0, -0.08, 0, -90, (1, 0, 0)))
+        gluCylinder(_get_quadric(), 0.08, 0.05, 0.15, slices, 1)
+        glPopMatrix()
 
     def _create_display_list(self):
         """Create optimized display list for the trophy."""
+        self._compile_shared_lists()
         self.display_list = glGenLists(1)
         glNewList(self.display_list, GL_COMPILE)
         self._render_trophy()
         glEndList()
+        Trophy._display_lists[self.planet_name] = self.display_list
+
+        self._detail = Trophy._LOW_DETAIL
+        self.display_list_low = glGenLists(1)
+        glNewList(self.display_list_low, GL_COMPILE)
+        self._render_trophy()
+        glEndList()
+        del self._detail
+        Trophy._low_detail_lists[self.planet_name] = self.display_list_low
+
+        transparent_func = Trophy._TRANSPARENT_RENDERERS.get(self.planet_name)
+        if transparent_func is not None:
+            color, accent = self._trophy_colors()
+            self.display_list_transparent = glGenLists(1)
+            glNewList(self.display_list_transparent, GL_COMPILE)
+            transparent_func(self, color, accent)
+            glEndList()
+            Trophy._transparent_lists[self.planet_name] = self.display_list_transparent
+
+    def _trophy_colors(self):
+        """Main and accent colors for this trophy's planet."""
+        return (self.TROPHY_COLORS.get(self.planet_name, (1.0, 0.8, 0.2)),
+                self.ACCENT_COLORS.get(self.planet_name, (1.0, 1.0, 1.0)))
 
     def _render_trophy(self):
         """Render the trophy based on planet type."""
-        color = self.TROPHY_COLORS.get(self.planet_name, (1.0, 0.8, 0.2))
-        accent = self.ACCENT_COLORS.get(self.planet_name, (1.0, 1.0, 1.0))
+        color, accent = self._trophy_colors()
 
         # Call specific trophy renderer based on planet
-        render_func = getattr(
-            self, f'_render_{self.planet_name.lower()}_trophy', self._render_default_trophy)
-        render_func(color, accent)
+        render_func = Trophy._RENDERERS.get(
+            self.planet_name, Trophy._render_default_trophy)
+        render_func(self, color, accent)
 
     def _render_default_trophy(self, color, accent):
         """Default star trophy."""
-        glColor3f(*color)
+        glColor3fv(color)
         self._draw_star(0, 0.5, 0.3, 5)
 
         # Base pedestal
-        glColor3f(*accent)
+        glColor3fv(accent)
         self._draw_cylinder(0, -0.2, 0.15, 0.3, 16)
 
     def _render_mercury_trophy(self, color, accent):
         """Elegant winged messenger trophy for Mercury - classic trophy cup with wings."""
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
+        quadric = _get_quadric()
+
+        # Parts are grouped by color (body, shadow, accent) to keep color
+        # changes to a minimum; all of them are opaque and depth tested.
 
         # Trophy cup bowl (classic trophy shape)
-        glColor3f(*color)
+        glColor3fv(color)
         glPushMatrix()
-        glTranslatef(0, 0.15, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, 0.06, 0.16, 0.22, 20, 5)
+        glMultMatrixf(_translate_rotate(0, 0.15, 0, -90, (1, 0, 0)))
+        gluCylinder(quadric, 0.06, 0.16, 0.22, self._lod(20), 5)
         glPopMatrix()
 
         # Cup rim (top lip)
         glPushMatrix()
-        glTranslatef(0, 0.37, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluDisk(quadric, 0.13, 0.17, 20, 2)
+        glMultMatrixf(_translate_rotate(0, 0.37, 0, -90, (1, 0, 0)))
+        gluDisk(quadric, 0.13, 0.17, self._lod(20), 2)
         glPopMatrix()
 
         # Trophy handle horizontal parts
+        self._draw_interleaved(
+            GL_TRIANGLES, self._build_tubes(_MERCURY_HANDLE_BAR, 0.015, 8))
+
+        # Trophy stem/neck
         glPushMatrix()
-        glTranslatef(-0.3, 0.17, 0)
-        glRotatef(90, 0, 1, 0)
-        gluCylinder(quadric, 0.015, 0.015, 0.6, 8, 1)
+        glMultMatrixf(_translate_rotate(0, 0.02, 0, -90, (1, 0, 0)))
+        gluCylinder(quadric, 0.035, 0.05, 0.13, 12, 1)
         glPopMatrix()
 
+        glCallList(self._shared("lower_stem"))
+
+        # Base - multi-tiered pedestal
+        self._draw_trophy_base(0, -0.18, 0.16, 0.1)
+
         # Cup interior shadow
-        glColor3f(color[0] * 0.6, color[1] * 0.6, color[2] * 0.6)
+        glColor3fv(_shade(color, 0.6))
         glPushMatrix()
-        glTranslatef(0, 0.37, 0)
-        glRotatef(90, 1, 0, 0)
-        gluDisk(quadric, 0, 0.13, 20, 1)
+        glMultMatrixf(_translate_rotate(0, 0.37, 0, 90, (1, 0, 0)))
+        gluDisk(quadric, 0, 0.13, self._lod(20), 1)
         glPopMatrix()
 
-        # Trophy handles (curved like real trophy)
-        for side in [-1, 1]:
-            # Vertical part of handle
-            glPushMatrix()
-            glTranslatef(side * 0.26, 0.18, 0)
-            glRotatef(-90, 1, 0, 0)
-            gluCylinder(quadric, 0.015, 0.015, 0.12, 8, 1)
-            glPopMatrix()
+        # Trophy handles (curved like real trophy): both vertical parts in one draw
+        self._draw_interleaved(
+            GL_TRIANGLES, self._build_tubes(_MERCURY_HANDLE_UPRIGHTS, 0.015, 8))
 
         # Decorative wings (Mercury's signature)
-        glColor3f(*accent)
+        glColor3fv(accent)
         for side in [-1, 1]:
             glPushMatrix()
             glTranslatef(side * 0.12, 0.32, 0)
@@ -123,126 +326,74 @@ class Trophy:
             self._draw_detailed_wing(0.22)
             glPopMatrix()
 
-        # Trophy stem/neck
-        glColor3f(*color)
-        glPushMatrix()
-        glTranslatef(0, 0.02, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, 0.035, 0.05, 0.13, 12, 1)
-        glPopMatrix()
-
-        glColor3f(*color)
-        glPushMatrix()
-        glTranslatef(0, -0.08, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, 0.08, 0.05, 0.15, 12, 1)
-        glPopMatrix()
-
-        # Base - multi-tiered pedestal
-        self._draw_trophy_base(0, -0.18, 0.16, 0.1)
-
         # Star ornament on top
-        glColor3f(*accent)
         glPushMatrix()
         glTranslatef(0, 0.42, 0.01)
         self._draw_star(0, 0, 0.06, 5)
         glPopMatrix()
 
-        gluDeleteQuadric(quadric)
-
     def _render_venus_trophy(self, color, accent):
         """Elegant heart trophy on pedestal for Venus (goddess of love)."""
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
+        quadric = _get_quadric()
 
         # Main 3D heart with depth
-        glColor3f(*color)
+        glColor3fv(color)
         glPushMatrix()
         glTranslatef(0, 0.35, 0)
         self._draw_3d_heart(0.22)
         glPopMatrix()
 
+        glCallList(self._shared("lower_stem"))
+
         # Decorative gems around heart
-        glColor3f(*accent)
-        for i in range(6):
-            angle = math.radians(i * 60)
-            x = 0.28 * math.cos(angle)
-            y = 0.35 + 0.2 * math.sin(angle)
+        glColor3fv(accent)
+        gem = self._shared("sphere_8")
+        for cos_a, sin_a in _CIRCLE_6[:6]:
+            x = 0.28 * cos_a
+            y = 0.35 + 0.2 * sin_a
             glPushMatrix()
             glTranslatef(x, y, 0)
-            gluSphere(quadric, 0.025, 8, 8)
+            glScalef(0.025, 0.025, 0.025)
+            glCallList(gem)
             glPopMatrix()
 
-        # Elegant thin stem
-        glColor3f(0.85, 0.65, 0.75)
+        # Decorative collar at stem top
         glPushMatrix()
-        glTranslatef(0, 0.05, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, 0.025, 0.04, 0.12, 12, 1)
+        glMultMatrixf(_translate_rotate(0, 0.17, 0, -90, (1, 0, 0)))
+        # Torus rim (GLUT tessellates it in C, normals included)
+        glutSolidTorus(0.015, 0.04, 12, 20)
         glPopMatrix()
 
-        # Decorative collar at stem top
-        glColor3f(*accent)
+        # Elegant thin stem
+        glColor3f(0.85, 0.65, 0.75)
         glPushMatrix()
-        glTranslatef(0, 0.17, 0)
-        glRotatef(-90, 1, 0, 0)
-        # Draw torus rim using glutSolidTorus or manual approximation
-        inner_radius = 0.015
-        outer_radius = 0.04
-        for i in range(20):
-            theta1 = i * 2 * math.pi / 20
-            theta2 = (i + 1) * 2 * math.pi / 20
-            glBegin(GL_QUAD_STRIP)
-            for j in range(13):
-                phi = j * 2 * math.pi / 12
-                for theta in [theta1, theta2]:
-                    x = (outer_radius + inner_radius *
-                         math.cos(phi)) * math.cos(theta)
-                    y = (outer_radius + inner_radius *
-                         math.cos(phi)) * math.sin(theta)
-                    z = inner_radius * math.sin(phi)
-                    glVertex3f(x, y, z)
-            glEnd()
+        glMultMatrixf(_translate_rotate(0, 0.05, 0, -90, (1, 0, 0)))
+        gluCylinder(quadric, 0.025, 0.04, 0.12, 12, 1)
         glPopMatrix()
 
         # Base pedestal - heart themed
         glColor3f(0.9, 0.6, 0.7)
         self._draw_trophy_base(0, -0.15, 0.15, 0.1)
 
-        glColor3f(*color)
-        glPushMatrix()
-        glTranslatef(0, -0.08, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, 0.08, 0.05, 0.15, 12, 1)
-        glPopMatrix()
-
-        gluDeleteQuadric(quadric)
-
     def _render_earth_trophy(self, color, accent):
         """Globe trophy on stand for Earth - world championship style."""
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
+        quadric = _get_quadric()
 
         # Globe sphere (Earth)
-        glColor3f(*color)
+        glColor3fv(color)
         glPushMatrix()
         glTranslatef(0, 0.38, 0)
-        gluSphere(quadric, 0.2, 24, 24)
+        gluSphere(quadric, 0.2, self._lod(24), self._lod(24))
 
         # Continent patches (green landmasses)
-        glColor3f(*accent)
+        glColor3fv(accent)
         # Add multiple smaller spheres to simulate continents
-        continent_positions = [
-            (0.15, 0.1, 0.1),    # North America area
-            (-0.1, 0.05, 0.15),  # Europe area
-            (0.05, -0.1, 0.15),  # Africa area
-            (-0.15, 0.0, -0.1),  # Asia area
-            (0.1, -0.12, -0.1),  # South America area
-        ]
-        for pos in continent_positions:
+        continent = self._shared("sphere_8")
+        for pos in _EARTH_CONTINENTS:
             glPushMatrix()
             glTranslatef(*pos)
-            gluSphere(quadric, 0.06, 8, 8)
+            glScalef(0.06, 0.06, 0.06)
+            glCallList(continent)
             glPopMatrix()
         glPopMatrix()
 
@@ -252,21 +403,19 @@ class Trophy:
         glTranslatef(0, 0.38, 0)
         glRotatef(23.5, 0, 0, 1)  # Earth's axial tilt
         glRotatef(90, 1, 0, 0)
-        gluCylinder(quadric, 0.24, 0.24, 0.015, 24, 1)
+        gluCylinder(quadric, 0.24, 0.24, 0.015, self._lod(24), 1)
         glPopMatrix()
 
         # Vertical support arc
         glPushMatrix()
-        glTranslatef(0, -0.1, 0)
-        glRotatef(-90, 1, 0, 0)
+        glMultMatrixf(_translate_rotate(0, -0.1, 0, -90, (1, 0, 0)))
         gluCylinder(quadric, 0.015, 0.015, 0.3, 8, 1)
         glPopMatrix()
 
         # Stem
         glColor3f(0.5, 0.4, 0.3)
         glPushMatrix()
-        glTranslatef(0, 0.02, 0)
-        glRotatef(-90, 1, 0, 0)
+        glMultMatrixf(_translate_rotate(0, 0.02, 0, -90, (1, 0, 0)))
         gluCylinder(quadric, 0.03, 0.045, 0.15, 12, 1)
         glPopMatrix()
 
@@ -274,24 +423,21 @@ class Trophy:
         glColor3f(0.45, 0.35, 0.2)
         self._draw_trophy_base(0, -0.18, 0.18, 0.1)
 
-        gluDeleteQuadric(quadric)
-
     def _render_mars_trophy(self, color, accent):
         """Red crystal cluster trophy for Mars - dramatic red crystals."""
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
+        quadric = _get_quadric()
 
         # Main large crystal
-        glColor3f(*color)
+        glColor3fv(color)
         self._draw_hex_crystal(0, 0, 0, 0.12, 0.45)
 
         # Secondary crystals around main
-        glColor3f(color[0] * 0.9, color[1] * 0.8, color[2] * 0.8)
+        glColor3fv(_shade(color, (0.9, 0.8, 0.8)))
         self._draw_hex_crystal(-0.12, 0, 0.05, 0.07, 0.3)
         self._draw_hex_crystal(0.1, 0, -0.06, 0.06, 0.25)
 
         # Small accent crystals
-        glColor3f(*accent)
+        glColor3fv(accent)
         self._draw_hex_crystal(-0.08, 0., -0.1, 0.04, 0.18)
         self._draw_hex_crystal(0.14, 0, 0.08, 0.035, 0.15)
         self._draw_hex_crystal(-0.15, 0.0, 0.1, 0.03, 0.12)
@@ -306,749 +452,533 @@ class Trophy:
 
         # Add small rocks on base
         glColor3f(0.4, 0.2, 0.1)
-        for i in range(5):
-            angle = math.radians(i * 72 + 15)
-            x = 0.15 * math.cos(angle)
-            z = 0.15 * math.sin(angle)
+        rock = self._shared("sphere_6")
+        for pos in _MARS_ROCKS:
             glPushMatrix()
-            glTranslatef(x, -0.1, z)
-            gluSphere(quadric, 0.04, 6, 6)
+            glTranslatef(*pos)
+            glScalef(0.04, 0.04, 0.04)
+            glCallList(rock)
             glPopMatrix()
 
-        gluDeleteQuadric(quadric)
-
     def _render_jupiter_trophy(self, color, accent):
         """Royal crown trophy for Jupiter (king of gods)."""
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
+        quadric = _get_quadric()
 
         # Crown base ring
-        glColor3f(*color)
+        glColor3fv(color)
         glPushMatrix()
-        glTranslatef(0, 0.2, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, 0.18, 0.2, 0.08, 20, 2)
+        glMultMatrixf(_translate_rotate(0, 0.2, 0, -90, (1, 0, 0)))
+        gluCylinder(quadric, 0.18, 0.2, 0.08, self._lod(20), 2)
+        glPopMatrix()
+
+        # Trophy stem
+        glPushMatrix()
+        glMultMatrixf(_translate_rotate(0, 0.02, 0, -90, (1, 0, 0)))
+        gluCylinder(quadric, 0.04, 0.06, 0.18, 12, 1)
         glPopMatrix()
 
+        glCallList(self._shared("lower_stem"))
+
         # Crown points (5 points like royal crown)
-        for i in range(5):
-            angle = math.radians(i * 72)
-            x = 0.15 * math.cos(angle)
-            z = 0.15 * math.sin(angle)
+        point = self._shared("cone_8")
+        for cos_a, sin_a in _CIRCLE_5:
+            x = 0.15 * cos_a
+            z = 0.15 * sin_a
             glPushMatrix()
             glTranslatef(x, 0.28, z)
             # Crown point
             glRotatef(-90, 1, 0, 0)
-            gluCylinder(quadric, 0.04, 0.0, 0.2, 8, 3)
+            glScalef(0.04, 0.04, 0.2)
+            glCallList(point)
             glPopMatrix()
 
         # Gems on crown points
-        glColor3f(*accent)
-        for i in range(5):
-            angle = math.radians(i * 72)
-            x = 0.15 * math.cos(angle)
-            z = 0.15 * math.sin(angle)
+        glColor3fv(accent)
+        gem = self._shared("sphere_10")
+        for cos_a, sin_a in _CIRCLE_5:
+            x = 0.15 * cos_a
+            z = 0.15 * sin_a
             glPushMatrix()
             glTranslatef(x, 0.46, z)
-            gluSphere(quadric, 0.035, 10, 10)
+            glScalef(0.035, 0.035, 0.035)
+            glCallList(gem)
             glPopMatrix()
 
         # Central large gem
         glColor3f(0.8, 0.2, 0.2)  # Ruby red
         glPushMatrix()
         glTranslatef(0, 0.35, 0)
-        gluSphere(quadric, 0.05, 12, 12)
+        glScalef(0.05, 0.05, 0.05)
+        glCallList(self._shared("sphere_12"))
         glPopMatrix()
 
         # Crown band decoration
-        glColor3f(color[0] * 0.8, color[1] * 0.7, color[2] * 0.5)
-        glPushMatrix()
-        glTranslatef(0, 0.24, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, 0.19, 0.19, 0.02, 20, 1)
-        glPopMatrix()
-
-        # Trophy stem
-        glColor3f(*color)
+        glColor3fv(_shade(color, (0.8, 0.7, 0.5)))
         glPushMatrix()
-        glTranslatef(0, 0.02, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, 0.04, 0.06, 0.18, 12, 1)
-        glPopMatrix()
-
-        glColor3f(*color)
-        glPushMatrix()
-        glTranslatef(0, -0.08, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, 0.08, 0.05, 0.15, 12, 1)
+        glMultMatrixf(_translate_rotate(0, 0.24, 0, -90, (1, 0, 0)))
+        gluCylinder(quadric, 0.19, 0.19, 0.02, self._lod(20), 1)
         glPopMatrix()
 
         # Royal base
         glColor3f(0.7, 0.55, 0.2)
         self._draw_trophy_base(0, -0.18, 0.17, 0.1)
 
-        gluDeleteQuadric(quadric)
-
     def _render_saturn_trophy(self, color, accent):
         """Ringed planet trophy for Saturn - iconic ringed sphere on stand."""
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
+        quadric = _get_quadric()
 
         # Planet sphere (slightly flattened like Saturn)
-        glColor3f(*color)
+        glColor3fv(color)
         glPushMatrix()
         glTranslatef(0, 0.38, 0)
         glScalef(1.0, 0.85, 1.0)
-        gluSphere(quadric, 0.18, 20, 20)
+        gluSphere(quadric, 0.18, self._lod(20), self._lod(20))
         glPopMatrix()
 
+        glCallList(self._shared("lower_stem"))
+
         # Iconic rings - multiple concentric rings
         glPushMatrix()
         glTranslatef(0, 0.38, 0)
         glRotatef(25, 1, 0, 0)  # Tilted rings
 
         # Inner ring
-        glColor3f(accent[0] * 0.8, accent[1] * 0.7, accent[2] * 0.6)
-        gluDisk(quadric, 0.22, 0.28, 30, 2)
+        glColor3fv(_shade(accent, (0.8, 0.7, 0.6)))
+        gluDisk(quadric, 0.22, 0.28, self._lod(30), 2)
 
         # Outer ring
-        glColor3f(*accent)
-        gluDisk(quadric, 0.3, 0.38, 30, 2)
+        glColor3fv(accent)
+        gluDisk(quadric, 0.3, 0.38, self._lod(30), 2)
 
         # Ring gap (dark band)
-        glColor3f(color[0] * 0.5, color[1] * 0.4, color[2] * 0.3)
-        gluDisk(quadric, 0.28, 0.3, 30, 1)
+        glColor3fv(_shade(color, (0.5, 0.4, 0.3)))
+        gluDisk(quadric, 0.28, 0.3, self._lod(30), 1)
         glPopMatrix()
 
         # Band on planet
-        glColor3f(color[0] * 0.85, color[1] * 0.8, color[2] * 0.7)
+        glColor3fv(_shade(color, (0.85, 0.8, 0.7)))
         glPushMatrix()
-        glTranslatef(0, 0.38, 0)
-        glRotatef(90, 1, 0, 0)
-        gluCylinder(quadric, 0.19, 0.19, 0.02, 20, 1)
+        glMultMatrixf(_translate_rotate(0, 0.38, 0, 90, (1, 0, 0)))
+        gluCylinder(quadric, 0.19, 0.19, 0.02, self._lod(20), 1)
         glPopMatrix()
 
         # Elegant curved support
         glColor3f(0.65, 0.55, 0.25)
         glPushMatrix()
-        glTranslatef(0, 0.05, 0)
-        glRotatef(-90, 1, 0, 0)
+        glMultMatrixf(_translate_rotate(0, 0.05, 0, -90, (1, 0, 0)))
         gluCylinder(quadric, 0.03, 0.04, 0.15, 12, 1)
         glPopMatrix()
 
-        glColor3f(*color)
-        glPushMatrix()
-        glTranslatef(0, -0.08, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, 0.08, 0.05, 0.15, 12, 1)
-        glPopMatrix()
-
         # Base - elegant gold style
         glColor3f(0.7, 0.6, 0.25)
         self._draw_trophy_base(0, -0.15, 0.16, 0.1)
 
-        gluDeleteQuadric(quadric)
-
     def _render_uranus_trophy(self, color, accent):
         """Elegant tilted ice planet trophy for Uranus - the sideways ice giant."""
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
+        quadric = _get_quadric()
 
         # Main ice planet sphere (tilted like Uranus' famous 98° axial tilt)
-        glColor3f(*color)
+        glColor3fv(color)
         glPushMatrix()
         glTranslatef(0, 0.32, 0)
         glRotatef(82, 0, 0, 1)  # Uranus' iconic tilt
         glScalef(1.0, 0.92, 1.0)  # Slightly flattened
-        gluSphere(quadric, 0.18, 24, 24)
+        gluSphere(quadric, 0.18, self._lod(24), self._lod(24))
+        glPopMatrix()
+
+        # Crystal collar where planet meets stand
+        glColor3fv(accent)
+        glPushMatrix()
+        glMultMatrixf(_translate_rotate(0, 0.14, 0, -90, (1, 0, 0)))
+        gluDisk(quadric, 0.02, 0.07, 6, 1)
         glPopMatrix()
 
-        # Tilted ring system (Uranus has vertical rings due to tilt)
-        glColor3f(accent[0], accent[1], accent[2])
+        # Tilted ring system (Uranus has vertical rings due to tilt), same accent
         glPushMatrix()
         glTranslatef(0, 0.32, 0)
         glRotatef(82, 0, 0, 1)  # Match planet tilt
         glRotatef(90, 1, 0, 0)
         # Inner ring
-        gluDisk(quadric, 0.22, 0.26, 32, 2)
+        gluDisk(quadric, 0.22, 0.26, self._lod(32), 2)
         # Outer ring
         glColor4f(accent[0] * 0.8, accent[1] * 0.9, accent[2], 0.7)
-        gluDisk(quadric, 0.27, 0.30, 32, 1)
+        gluDisk(quadric, 0.27, 0.30, self._lod(32), 1)
         glPopMatrix()
 
         # Elegant crystal stand (ice-themed)
         glColor3f(0.6, 0.8, 0.9)
         # Main stem - twisted ice crystal effect
         glPushMatrix()
-        glTranslatef(0, 0.0, 0)
-        glRotatef(-90, 1, 0, 0)
+        glMultMatrixf(_translate_rotate(0, 0.0, 0, -90, (1, 0, 0)))
         gluCylinder(quadric, 0.03, 0.05, 0.14, 6, 1)  # Hexagonal like ice
         glPopMatrix()
 
-        # Crystal collar where planet meets stand
-        glColor3f(*accent)
-        glPushMatrix()
-        glTranslatef(0, 0.14, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluDisk(quadric, 0.02, 0.07, 6, 1)
-        glPopMatrix()
-
         # Decorative ice crystals around base
         glColor3f(0.7, 0.9, 1.0)
-        for i in range(6):
-            angle = math.radians(i * 60)
-            x = 0.12 * math.cos(angle)
-            z = 0.12 * math.sin(angle)
+        crystal = self._shared("cone_6")
+        for i, (cos_a, sin_a) in enumerate(_CIRCLE_6[:6]):
+            x = 0.12 * cos_a
+            z = 0.12 * sin_a
             height = 0.08 + 0.03 * math.sin(i * 2)
             glPushMatrix()
             glTranslatef(x, -0.12, z)
             glRotatef(-90, 1, 0, 0)
             glRotatef(i * 15, 0, 0, 1)  # Slight rotation for variety
-            gluCylinder(quadric, 0.02, 0.0, height, 6, 1)
+            glScalef(0.02, 0.02, height)
+            glCallList(crystal)
             glPopMatrix()
 
         # Elegant multi-tiered ice base
         glColor3f(0.5, 0.7, 0.85)
         self._draw_trophy_base(0, -0.18, 0.16, 0.1)
 
-        glPushMatrix()
-        glTranslatef(0, -0.08, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, 0.08, 0.05, 0.15, 12, 1)
-        glPopMatrix()
+        glCallList(self._shared("lower_stem"))
 
         # Small accent gems on base corners
         glColor3f(0.4, 0.9, 1.0)
-        for i in range(4):
-            angle = math.radians(i * 90 + 45)
-            x = 0.13 * math.cos(angle)
-            z = 0.13 * math.sin(angle)
+        gem = self._shared("sphere_8")
+        for cos_a, sin_a in _CIRCLE_4_DIAGONAL:
+            x = 0.13 * cos_a
+            z = 0.13 * sin_a
             glPushMatrix()
             glTranslatef(x, -0.12, z)
-            gluSphere(quadric, 0.02, 8, 8)
+            glScalef(0.02, 0.02, 0.02)
+            glCallList(gem)
             glPopMatrix()
 
-        gluDeleteQuadric(quadric)
-
     def _render_neptune_trophy(self, color, accent):
         """Trident trophy for Neptune (god of the sea) - classic trident on wave base."""
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
+        quadric = _get_quadric()
 
         # Trident shaft
-        glColor3f(*color)
+        glColor3fv(color)
         glPushMatrix()
-        glTranslatef(0, -0.1, 0)
-        glRotatef(-90, 1, 0, 0)
+        glMultMatrixf(_translate_rotate(0, -0.1, 0, -90, (1, 0, 0)))
         gluCylinder(quadric, 0.025, 0.03, 0.5, 12, 1)
         glPopMatrix()
 
         # Trident head crossbar
         glPushMatrix()
-        glTranslatef(0, 0.4, 0)
-        glRotatef(90, 0, 1, 0)
+        glMultMatrixf(_translate_rotate(0, 0.4, 0, 90, (0, 1, 0)))
         gluCylinder(quadric, 0.02, 0.02, 0.12, 8, 1)
         glPopMatrix()
         glPushMatrix()
-        glTranslatef(0, 0.4, 0)
-        glRotatef(-90, 0, 1, 0)
+        glMultMatrixf(_translate_rotate(0, 0.4, 0, -90, (0, 1, 0)))
         gluCylinder(quadric, 0.02, 0.02, 0.12, 8, 1)
         glPopMatrix()
 
         # Center prong
         glPushMatrix()
-        glTranslatef(0, 0.4, 0)
-        glRotatef(-90, 1, 0, 0)
+        glMultMatrixf(_translate_rotate(0, 0.4, 0, -90, (1, 0, 0)))
         gluCylinder(quadric, 0.02, 0.0, 0.18, 8, 1)
         glPopMatrix()
 
         # Left prong
         glPushMatrix()
-        glTranslatef(-0.12, 0.4, 0)
-        glRotatef(-90, 1, 0, 0)
+        glMultMatrixf(_translate_rotate(-0.12, 0.4, 0, -90, (1, 0, 0)))
         gluCylinder(quadric, 0.018, 0.0, 0.14, 8, 1)
         glPopMatrix()
 
         # Right prong
         glPushMatrix()
-        glTranslatef(0.12, 0.4, 0)
-        glRotatef(-90, 1, 0, 0)
+        glMultMatrixf(_translate_rotate(0.12, 0.4, 0, -90, (1, 0, 0)))
         gluCylinder(quadric, 0.018, 0.0, 0.14, 8, 1)
         glPopMatrix()
 
         # Decorative element on shaft
-        glColor3f(*accent)
+        glColor3fv(accent)
         glPushMatrix()
         glTranslatef(0, 0.38, 0)
         gluSphere(quadric, 0.04, 10, 10)
         glPopMatrix()
 
         # Wave-themed base
-        glColor3f(accent[0] * 0.7, accent[1] * 0.8, accent[2])
+        glColor3fv(_shade(accent, (0.7, 0.8, 1.0)))
         self._draw_wave_pedestal(0, -0.15, 0.18)
 
-        gluDeleteQuadric(quadric)
-
     def _render_sun_trophy(self, color, accent):
         """Solar sun trophy - radiant sun with rays on golden pedestal."""
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
+        quadric = _get_quadric()
 
         # Central sun orb with glow effect
-        glColor3f(*color)
+        glColor3fv(color)
         glPushMatrix()
         glTranslatef(0, 0.38, 0)
-        gluSphere(quadric, 0.16, 20, 20)
+        gluSphere(quadric, 0.16, self._lod(20), self._lod(20))
         glPopMatrix()
 
+        glCallList(self._shared("lower_stem"))
+
         # Radiating sun rays (3D pointed rays)
-        glColor3f(*accent)
-        for i in range(12):
-            angle = math.radians(-i * 30)
-            x = 0.18 * math.cos(angle)
-            y = 0.38 + 0.18 * math.sin(angle)
+        glColor3fv(accent)
+        ray = self._shared("cone_6")
+        for i, (cos_a, sin_a) in enumerate(_SUN_RAYS):
+            x = 0.18 * cos_a
+            y = 0.38 + 0.18 * sin_a
             length = 0.18 if i % 2 == 0 else 0.12  # Alternating long/short rays
 
             glPushMatrix()
             glTranslatef(x, y, 0)
             glRotatef(i * -30, 0, 0, 1)
             glRotatef(90, 0, 1, 0)
-            gluCylinder(quadric, 0.025, 0.0, length, 6, 1)
+            glScalef(0.025, 0.025, length)
+            glCallList(ray)
             glPopMatrix()
 
         # Inner glow ring
-        glColor3f(color[0], color[1] * 0.9, color[2] * 0.6)
+        glColor3fv(_shade(color, (1.0, 0.9, 0.6)))
         glPushMatrix()
         glTranslatef(0, 0.38, 0.01)
-        gluDisk(quadric, 0.14, 0.2, 20, 1)
+        gluDisk(quadric, 0.14, 0.2, self._lod(20), 1)
         glPopMatrix()
 
-        # Corona effect (outer glow)
-        glColor4f(accent[0], accent[1], accent[2], 0.3)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glPushMatrix()
-        glTranslatef(0, 0.38, 0)
-        gluSphere(quadric, 0.22, 16, 16)
-        glPopMatrix()
-        glDisable(GL_BLEND)
-
         # Elegant stem
         glColor3f(0.85, 0.6, 0.2)
         glPushMatrix()
-        glTranslatef(0, 0.02, 0)
-        glRotatef(-90, 1, 0, 0)
+        glMultMatrixf(_translate_rotate(0, 0.02, 0, -90, (1, 0, 0)))
         gluCylinder(quadric, 0.03, 0.05, 0.15, 12, 1)
         glPopMatrix()
 
-        glColor3f(*color)
-        glPushMatrix()
-        glTranslatef(0, -0.08, 0)
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, 0.08, 0.05, 0.15, 12, 1)
-        glPopMatrix()
-
         # Golden sun base
         glColor3f(0.8, 0.5, 0.15)
         self._draw_trophy_base(0, -0.18, 0.17, 0.1)
 
-        gluDeleteQuadric(quadric)
+    def _render_sun_corona(self, color, accent):
+        """
+        Translucent corona around the sun orb. Compiled into the transparent
+        list; the caller owns the GL_BLEND state.
+        """
+        glColor4f(accent[0], accent[1], accent[2], 0.3)
+        glPushMatrix()
+        glTranslatef(0, 0.38, 0)
+        glScalef(0.22, 0.22, 0.22)
+        glCallList(self._shared("sphere_12"))
+        glPopMatrix()
 
     # Helper drawing methods
+    @classmethod
+    def _cached_vertices(cls, key, build):
+        """
+        Return the vertex array(s) for `key`, building them on first use.
+
+        `build` returns a flat float list or a tuple of them; each list is
+        stored as a contiguous GLfloat buffer so glVertexPointer doesn't have
+        to convert a Python list on every call.
+        """
+        vertices = cls._vertex_arrays.get(key)
+        if vertices is None:
+            vertices = build()
+            if isinstance(vertices, tuple):
+                vertices = tuple(_float_buffer(v) for v in vertices)
+            else:
+                vertices = _float_buffer(vertices)
+            cls._vertex_arrays[key] = vertices
+        return vertices
+
+    @staticmethod
+    def _draw_vertex_array(mode, vertices, normals=None):
+        """Submit a flat [x, y, z, ...] buffer (and optional normals) with a single glDrawArrays."""
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, vertices)
+        if normals is not None:
+            glEnableClientState(GL_NORMAL_ARRAY)
+            glNormalPointer(GL_FLOAT, 0, normals)
+        glDrawArrays(mode, 0, len(vertices) // 3)
+        if normals is not None:
+            glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    @staticmethod
+    def _draw_interleaved(mode, data):
+        """Submit an interleaved [nx, ny, nz, x, y, z, ...] buffer (GL_N3F_V3F)."""
+        glInterleavedArrays(GL_N3F_V3F, 0, data)
+        glDrawArrays(mode, 0, len(data) // 6)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    @classmethod
+    def _build_tubes(cls, segments, radius, slices):
+        """
+        Open tubes (like gluCylinder without caps) along each (start, end)
+        segment, merged into one GL_TRIANGLES array with smooth normals.
+        Returns a single interleaved N3F_V3F buffer, cached by the parameters.
+        """
+        def build():
+            data = []
+            angles = [(math.cos(j * 2 * math.pi / slices),
+                       math.sin(j * 2 * math.pi / slices)) for j in range(slices + 1)]
+            for start, end in segments:
+                axis = [e - b for b, e in zip(start, end)]
+                length = math.sqrt(sum(a * a for a in axis))
+                d = [a / length for a in axis]
+                # Right-handed frame (u, v, d) so the triangles wind CCW outward
+                ref = (1.0, 0.0, 0.0) if abs(d[0]) < 0.9 else (0.0, 1.0, 0.0)
+                u = [ref[1] * d[2] - ref[2] * d[1],
+                     ref[2] * d[0] - ref[0] * d[2],
+                     ref[0] * d[1] - ref[1] * d[0]]
+                u_len = math.sqrt(sum(a * a for a in u))
+                u = [a / u_len for a in u]
+                v = [d[1] * u[2] - d[2] * u[1],
+                     d[2] * u[0] - d[0] * u[2],
+                     d[0] * u[1] - d[1] * u[0]]
+
+                ring = [[c * u[k] + s * v[k] for k in range(3)] for c, s in angles]
+                for j in range(slices):
+                    n0, n1 = ring[j], ring[j + 1]
+                    b0 = [start[k] + radius * n0[k] for k in range(3)]
+                    b1 = [start[k] + radius * n1[k] for k in range(3)]
+                    t0 = [end[k] + radius * n0[k] for k in range(3)]
+                    t1 = [end[k] + radius * n1[k] for k in range(3)]
+                    for point, normal in ((b0, n0), (b1, n1), (t0, n0),
+                                          (t0, n0), (b1, n1), (t1, n1)):
+                        data.extend(normal)
+                        data.extend(point)
+            return data
+
+        return cls._cached_vertices(("tubes", segments, radius, slices), build)
+
     def _draw_star(self, x, y, size, points):
         """Draw a 2D star shape."""
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(x, y, 0)
-        for i in range(points * 2 + 1):
-            angle = math.pi / 2 + i * math.pi / points
-            r = size if i % 2 == 0 else size * 0.4
-            px = x + r * math.cos(angle)
-            py = y + r * math.sin(angle)
-            glVertex3f(px, py, 0)
-        glEnd()
+        def build():
+            vertices = [x, y, 0]
+            for i in range(points * 2 + 1):
+                angle = math.pi / 2 + i * math.pi / points
+                r = size if i % 2 == 0 else size * 0.4
+                vertices.extend((x + r * math.cos(angle), y + r * math.sin(angle), 0))
+            return vertices
+
+        self._draw_vertex_array(
+            GL_TRIANGLE_FAN,
+            self._cached_vertices(("star", x, y, size, points), build))
 
     def _draw_cylinder(self, x, y, radius, height, slices):
         """Draw a cylinder."""
-        quadric = gluNewQuadric()
+        quadric = _get_quadric()
         glPushMatrix()
-        glTranslatef(x, y, 0)
-        glRotatef(-90, 1, 0, 0)
+        glMultMatrixf(_translate_rotate(x, y, 0, -90, (1, 0, 0)))
         gluCylinder(quadric, radius, radius, height, slices, 1)
         gluDisk(quadric, 0, radius, slices, 1)
         glTranslatef(0, 0, height)
         gluDisk(quadric, 0, radius, slices, 1)
         glPopMatrix()
-        gluDeleteQuadric(quadric)
-
-    def _draw_wing(self, size):
-        """Draw a wing shape."""
-        glBegin(GL_TRIANGLES)
-        glVertex3f(0, 0, 0)
-        glVertex3f(size, 0.1, 0)
-        glVertex3f(size * 0.7, 0.15, 0)
-
-        glVertex3f(0, 0, 0)
-        glVertex3f(size * 0.7, 0.15, 0)
-        glVertex3f(size * 0.5, 0.2, 0)
-
-        glVertex3f(0, 0, 0)
-        glVertex3f(size * 0.5, 0.2, 0)
-        glVertex3f(size * 0.3, 0.15, 0)
-        glEnd()
-
-    def _draw_heart(self, x, y, size):
-        """Draw a 3D heart shape."""
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(x, y - size * 0.5, 0)
-        for i in range(37):
-            angle = math.radians(i * 10)
-            hx = size * 0.5 * (16 * math.sin(angle) ** 3) / 16
-            hy = size * 0.5 * (13 * math.cos(angle) - 5 * math.cos(2*angle) -
-                               2 * math.cos(3*angle) - math.cos(4*angle)) / 16
-            glVertex3f(x + hx, y + hy, 0)
-        glEnd()
-
-    def _draw_diamond(self, x, y, size):
-        """Draw a small diamond sparkle."""
-        glBegin(GL_TRIANGLES)
-        glVertex3f(x, y + size, 0)
-        glVertex3f(x - size * 0.5, y, 0)
-        glVertex3f(x + size * 0.5, y, 0)
-
-        glVertex3f(x, y - size, 0)
-        glVertex3f(x - size * 0.5, y, 0)
-        glVertex3f(x + size * 0.5, y, 0)
-        glEnd()
-
-    def _draw_crystal(self, x, y, base_size, height):
-        """Draw a crystal shape."""
-        glBegin(GL_TRIANGLES)
-        # Four faces of crystal
-        for i in range(4):
-            angle1 = math.radians(i * 90)
-            angle2 = math.radians((i + 1) * 90)
-            x1 = x + base_size * math.cos(angle1)
-            z1 = base_size * math.sin(angle1)
-            x2 = x + base_size * math.cos(angle2)
-            z2 = base_size * math.sin(angle2)
-
-            # Top point
-            glVertex3f(x, y + height, 0)
-            glVertex3f(x1, y, z1)
-            glVertex3f(x2, y, z2)
-        glEnd()
-
-    def _draw_rocky_base(self, x, y, width, height):
-        """Draw an irregular rocky base."""
-        quadric = gluNewQuadric()
-        glPushMatrix()
-        glTranslatef(x, y, 0)
-        glScalef(1.0, 0.6, 1.0)
-        gluSphere(quadric, width, 8, 6)
-        glPopMatrix()
-        gluDeleteQuadric(quadric)
-
-    def _draw_lightning_bolt(self, x, y, height):
-        """Draw a lightning bolt shape."""
-        glBegin(GL_TRIANGLES)
-        # Main bolt
-        glVertex3f(x + 0.1, y + height * 0.5, 0)
-        glVertex3f(x - 0.05, y + height * 0.2, 0)
-        glVertex3f(x + 0.05, y + height * 0.25, 0)
-
-        glVertex3f(x + 0.05, y + height * 0.25, 0)
-        glVertex3f(x - 0.05, y + height * 0.2, 0)
-        glVertex3f(x - 0.1, y - height * 0.5, 0)
-
-        glVertex3f(x + 0.05, y + height * 0.25, 0)
-        glVertex3f(x - 0.1, y - height * 0.5, 0)
-        glVertex3f(x + 0.02, y, 0)
-        glEnd()
-
-    def _draw_cloudy_base(self, x, y, size):
-        """Draw a cloudy base."""
-        quadric = gluNewQuadric()
-        for i in range(5):
-            angle = math.radians(i * 72)
-            cx = x + size * 0.5 * math.cos(angle)
-            cz = size * 0.5 * math.sin(angle)
-            glPushMatrix()
-            glTranslatef(cx, y, cz)
-            gluSphere(quadric, size * 0.4, 8, 8)
-            glPopMatrix()
-        gluDeleteQuadric(quadric)
-
-    def _draw_elegant_base(self, x, y, size):
-        """Draw an elegant pedestal base."""
-        quadric = gluNewQuadric()
-        glPushMatrix()
-        glTranslatef(x, y, 0)
-        glRotatef(-90, 1, 0, 0)
-        # Bottom disk
-        gluDisk(quadric, 0, size * 1.2, 16, 1)
-        # Middle section
-        gluCylinder(quadric, size, size * 0.8, 0.1, 16, 1)
-        glTranslatef(0, 0, 0.1)
-        gluCylinder(quadric, size * 0.8, size * 0.6, 0.1, 16, 1)
-        glPopMatrix()
-        gluDeleteQuadric(quadric)
-
-    def _draw_diamond_3d(self, x, y, size):
-        """Draw a 3D diamond shape."""
-        glBegin(GL_TRIANGLES)
-        # Top pyramid
-        for i in range(6):
-            angle1 = math.radians(i * 60)
-            angle2 = math.radians((i + 1) * 60)
-            x1 = x + size * 0.5 * math.cos(angle1)
-            z1 = size * 0.5 * math.sin(angle1)
-            x2 = x + size * 0.5 * math.cos(angle2)
-            z2 = size * 0.5 * math.sin(angle2)
-
-            glVertex3f(x, y + size, 0)
-            glVertex3f(x1, y, z1)
-            glVertex3f(x2, y, z2)
-
-            # Bottom pyramid
-            glVertex3f(x, y - size * 0.5, 0)
-            glVertex3f(x2, y, z2)
-            glVertex3f(x1, y, z1)
-        glEnd()
-
-    def _draw_ice_crystal(self, x, y, z, size):
-        """Draw a small ice crystal."""
-        glPushMatrix()
-        glTranslatef(x, y, z)
-        glBegin(GL_LINES)
-        # Vertical line
-        glVertex3f(0, -size, 0)
-        glVertex3f(0, size, 0)
-        # Horizontal lines
-        for angle in [0, 60, 120]:
-            rad = math.radians(angle)
-            dx = size * 0.7 * math.cos(rad)
-            dz = size * 0.7 * math.sin(rad)
-            glVertex3f(-dx, 0, -dz)
-            glVertex3f(dx, 0, dz)
-        glEnd()
-        glPopMatrix()
-
-    def _draw_trident(self, x, y, height):
-        """Draw a trident shape."""
-        glLineWidth(3.0)
-        glBegin(GL_LINES)
-        # Main shaft
-        glVertex3f(x, y, 0)
-        glVertex3f(x, y + height * 0.7, 0)
-
-        # Center prong
-        glVertex3f(x, y + height * 0.7, 0)
-        glVertex3f(x, y + height, 0)
-
-        # Left prong
-        glVertex3f(x - 0.1, y + height * 0.6, 0)
-        glVertex3f(x - 0.15, y + height * 0.9, 0)
-
-        # Right prong
-        glVertex3f(x + 0.1, y + height * 0.6, 0)
-        glVertex3f(x + 0.15, y + height * 0.9, 0)
-
-        # Cross bar
-        glVertex3f(x - 0.1, y + height * 0.6, 0)
-        glVertex3f(x + 0.1, y + height * 0.6, 0)
-        glEnd()
-        glLineWidth(1.0)
-
-    def _draw_wave_base(self, x, y, size):
-        """Draw a wave-themed base."""
-        glBegin(GL_TRIANGLE_STRIP)
-        for i in range(21):
-            angle = math.radians(i * 18)
-            wave = 0.05 * math.sin(i * 0.8)
-            outer = size + wave
-            inner = size * 0.5 + wave
-            glVertex3f(x + outer * math.cos(angle), y +
-                       0.05, outer * math.sin(angle))
-            glVertex3f(x + inner * math.cos(angle), y -
-                       0.05, inner * math.sin(angle))
-        glEnd()
-
-    def _draw_ray(self, x, y, length, angle):
-        """Draw a sun ray."""
-        glPushMatrix()
-        glTranslatef(x, y, 0)
-        glRotatef(angle, 0, 0, 1)
-        glBegin(GL_TRIANGLES)
-        glVertex3f(0, 0, 0)
-        glVertex3f(length, 0.02, 0)
-        glVertex3f(length, -0.02, 0)
-        glEnd()
-        glPopMatrix()
 
     # New helper methods for detailed trophy models
     def _draw_trophy_base(self, x, y, radius, height):
         """Draw a multi-tiered trophy pedestal base."""
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
+        quadric = _get_quadric()
         glPushMatrix()
-        glTranslatef(x, y, 0)
-        glRotatef(-90, 1, 0, 0)
+        glMultMatrixf(_translate_rotate(x, y, 0, -90, (1, 0, 0)))
 
         # Bottom tier (largest)
-        gluDisk(quadric, 0, radius * 1.2, 16, 1)
-        gluCylinder(quadric, radius * 1.2, radius * 1.0, height * 0.3, 16, 1)
+        gluDisk(quadric, 0, radius * 1.2, self._lod(16), 1)
+        gluCylinder(quadric, radius * 1.2, radius * 1.0, height * 0.3, self._lod(16), 1)
         glTranslatef(0, 0, height * 0.3)
 
         # Middle tier
-        gluDisk(quadric, 0, radius * 1.0, 16, 1)
-        gluCylinder(quadric, radius * 1.0, radius * 0.7, height * 0.4, 16, 1)
+        gluDisk(quadric, 0, radius * 1.0, self._lod(16), 1)
+        gluCylinder(quadric, radius * 1.0, radius * 0.7, height * 0.4, self._lod(16), 1)
         glTranslatef(0, 0, height * 0.4)
 
         # Top tier (smallest)
-        gluDisk(quadric, 0, radius * 0.7, 16, 1)
-        gluCylinder(quadric, radius * 0.7, radius * 0.5, height * 0.3, 16, 1)
+        gluDisk(quadric, 0, radius * 0.7, self._lod(16), 1)
+        gluCylinder(quadric, radius * 0.7, radius * 0.5, height * 0.3, self._lod(16), 1)
         glTranslatef(0, 0, height * 0.3)
-        gluDisk(quadric, 0, radius * 0.5, 16, 1)
+        gluDisk(quadric, 0, radius * 0.5, self._lod(16), 1)
 
         glPopMatrix()
-        gluDeleteQuadric(quadric)
 
     def _draw_detailed_wing(self, size):
         """Draw a more detailed feathered wing shape."""
-        # Main wing surface
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(0, 0, 0)  # Wing base
-        glVertex3f(size * 0.3, 0.08, 0)
-        glVertex3f(size * 0.6, 0.12, 0)
-        glVertex3f(size * 0.85, 0.1, 0)
-        glVertex3f(size, 0.05, 0)
-        glVertex3f(size * 0.9, -0.02, 0)
-        glVertex3f(size * 0.7, -0.05, 0)
-        glVertex3f(size * 0.4, -0.03, 0)
-        glEnd()
-
-        # Feather details (lines)
+        def build():
+            # Main wing surface
+            surface = [
+                0, 0, 0,  # Wing base
+                size * 0.3, 0.08, 0,
+                size * 0.6, 0.12, 0,
+                size * 0.85, 0.1, 0,
+                size, 0.05, 0,
+                size * 0.9, -0.02, 0,
+                size * 0.7, -0.05, 0,
+                size * 0.4, -0.03, 0,
+            ]
+
+            # Feather details (lines)
+            feathers = []
+            for i in range(5):
+                t = (i + 1) / 6.0
+                feathers.extend((size * t * 0.3, 0.02 * t, 0,
+                                 size * t, 0.12 - 0.1 * t, 0))
+            return surface, feathers
+
+        surface, feathers = self._cached_vertices(("wing", size), build)
+        self._draw_vertex_array(GL_TRIANGLE_FAN, surface)
         glLineWidth(1.0)
-        glBegin(GL_LINES)
-        for i in range(5):
-            t = (i + 1) / 6.0
-            x1 = size * t * 0.3
-            y1 = 0.02 * t
-            x2 = size * t
-            y2 = 0.12 - 0.1 * t
-            glVertex3f(x1, y1, 0)
-            glVertex3f(x2, y2, 0)
-        glEnd()
+        self._draw_vertex_array(GL_LINES, feathers)
 
     def _draw_3d_heart(self, size):
         """Draw a 3D heart shape with depth."""
-        quadric = gluNewQuadric()
         # Two spheres for heart top lobes
-        glPushMatrix()
-        glTranslatef(-size * 0.25, size * 0.15, 0)
-        glScalef(1.0, 1.0, 0.4)
-        gluSphere(quadric, size * 0.35, 16, 16)
-        glPopMatrix()
-
-        glPushMatrix()
-        glTranslatef(size * 0.25, size * 0.15, 0)
-        glScalef(1.0, 1.0, 0.4)
-        gluSphere(quadric, size * 0.35, 16, 16)
-        glPopMatrix()
+        lobe = self._shared("sphere_12")
+        radius = size * 0.35
+        for x in (-size * 0.25, size * 0.25):
+            glPushMatrix()
+            glTranslatef(x, size * 0.15, 0)
+            glScalef(radius, radius, radius * 0.4)
+            glCallList(lobe)
+            glPopMatrix()
 
         # Heart point (cone pointing down)
         glPushMatrix()
         glTranslatef(0, -size * 0.05, 0)
         glScalef(1.0, 1.0, 0.35)
         glRotatef(90, 1, 0, 0)
-        gluCylinder(quadric, size * 0.45, 0, size * 0.5, 16, 4)
+        gluCylinder(_get_quadric(), size * 0.45, 0, size * 0.5, self._lod(16), 4)
         glPopMatrix()
 
-        gluDeleteQuadric(quadric)
-
     def _draw_hex_crystal(self, x, y, z, base_radius, height):
         """Draw a hexagonal crystal prism with pointed top."""
-        glPushMatrix()
-        glTranslatef(x, y, z)
+        def build():
+            # Hexagonal prism body
+            body = []
+            for cos_a, sin_a in _CIRCLE_6:
+                bx = base_radius * cos_a
+                bz = base_radius * sin_a
+                body.extend((bx, 0, bz, bx * 0.9, height * 0.7, bz * 0.9))
+
+            # Pointed top
+            top = [0, height, 0]  # Apex
+            for cos_a, sin_a in _CIRCLE_6:
+                top.extend((base_radius * 0.9 * cos_a, height * 0.7, base_radius * 0.9 * sin_a))
+
+            # Bottom cap
+            bottom = []
+            for cos_a, sin_a in _CIRCLE_6[:6]:
+                bottom.extend((base_radius * cos_a, 0, base_radius * sin_a))
+            return body, top, bottom
+
+        body, top, bottom = self._cached_vertices(
+            ("hex_crystal", base_radius, height), build)
 
-        # Hexagonal prism body
-        glBegin(GL_QUAD_STRIP)
-        for i in range(7):
-            angle = math.radians(i * 60)
-            bx = base_radius * math.cos(angle)
-            bz = base_radius * math.sin(angle)
-            glVertex3f(bx, 0, bz)
-            glVertex3f(bx * 0.9, height * 0.7, bz * 0.9)
-        glEnd()
-
-        # Pointed top
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(0, height, 0)  # Apex
-        for i in range(7):
-            angle = math.radians(i * 60)
-            tx = base_radius * 0.9 * math.cos(angle)
-            tz = base_radius * 0.9 * math.sin(angle)
-            glVertex3f(tx, height * 0.7, tz)
-        glEnd()
-
-        # Bottom cap
-        glBegin(GL_POLYGON)
-        for i in range(6):
-            angle = math.radians(i * 60)
-            glVertex3f(base_radius * math.cos(angle),
-                       0, base_radius * math.sin(angle))
-        glEnd()
-
-        glPopMatrix()
-
-    def _draw_faceted_gem(self, x, y, z, size):
-        """Draw a faceted gem (diamond cut style)."""
         glPushMatrix()
         glTranslatef(x, y, z)
-
-        # Crown (top octagonal pyramid)
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(0, size * 0.6, 0)  # Top point
-        for i in range(9):
-            angle = math.radians(i * 45)
-            gx = size * 0.7 * math.cos(angle)
-            gz = size * 0.7 * math.sin(angle)
-            glVertex3f(gx, size * 0.2, gz)
-        glEnd()
-
-        # Girdle (middle band)
-        glBegin(GL_QUAD_STRIP)
-        for i in range(9):
-            angle = math.radians(i * 45)
-            gx = size * 0.7 * math.cos(angle)
-            gz = size * 0.7 * math.sin(angle)
-            glVertex3f(gx, size * 0.2, gz)
-            glVertex3f(gx * 0.85, 0, gz * 0.85)
-        glEnd()
-
-        # Pavilion (bottom pyramid)
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(0, -size * 0.5, 0)  # Bottom point
-        for i in range(9):
-            angle = math.radians(i * 45)
-            gx = size * 0.7 * 0.85 * math.cos(angle)
-            gz = size * 0.7 * 0.85 * math.sin(angle)
-            glVertex3f(gx, 0, gz)
-        glEnd()
-
+        self._draw_vertex_array(GL_QUAD_STRIP, body)
+        self._draw_vertex_array(GL_TRIANGLE_FAN, top)
+        self._draw_vertex_array(GL_POLYGON, bottom)
         glPopMatrix()
 
     def _draw_wave_pedestal(self, x, y, size):
         """Draw a wave-themed pedestal base for Neptune trophy."""
-        quadric = gluNewQuadric()
-        gluQuadricNormals(quadric, GLU_SMOOTH)
+        quadric = _get_quadric()
 
         glPushMatrix()
         glTranslatef(x, y, 0)
 
         # Base disk
         glRotatef(-90, 1, 0, 0)
-        gluDisk(quadric, 0, size * 1.1, 16, 1)
+        glPushMatrix()
+        glScalef(size * 1.1, size * 1.1, 1.0)
+        glCallList(self._shared("disk_12"))
+        glPopMatrix()
 
         # Wave rings (undulating surface)
         for ring in range(3):
@@ -1056,15 +986,13 @@ class Trophy:
             height = 0.03 + ring * 0.02
             glPushMatrix()
             glTranslatef(0, 0, ring * 0.03)
-            gluCylinder(quadric, radius + 0.02, radius, height, 16, 1)
+            gluCylinder(quadric, radius + 0.02, radius, height, self._lod(16), 1)
             glPopMatrix()
 
         glPopMatrix()
-        gluDeleteQuadric(quadric)
 
-    def render(self, x=0, y=0, z=0, scale=1.0, rotation=None):
-        """Render the trophy at the given position."""
-        glPushMatrix()
+    def _apply_transform(self, x, y, z, scale, rotation):
+        """Place the trophy; the caller pushes and pops the matrix."""
         glTranslatef(x, y, z)
         glScalef(scale, scale, scale)
         if rotation is not None:
@@ -1072,21 +1000,75 @@ class Trophy:
         elif self.rotation != 0:
             glRotatef(self.rotation, 0, 1, 0)
 
-        if self.display_list:
-            glCallList(self.display_list)
+    def render(self, x=0, y=0, z=0, scale=1.0, rotation=None, transparent=True,
+               low_detail=False):
+        """
+        Render the trophy at the given position. With transparent=False only
+        the opaque list is drawn, leaving the blended parts to render_transparent.
+        low_detail=True draws the coarser list, for trophies shown small.
+        """
+        self.visible = True
+        glPushMatrix()
+        self._apply_transform(x, y, z, scale, rotation)
+
+        display_list = self.display_list
+        if low_detail and self.display_list_low:
+            display_list = self.display_list_low
+        if display_list:
+            glCallList(display_list)
+        if transparent and self.display_list_transparent:
+            glEnable(GL_BLEND)
+            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            glCallList(self.display_list_transparent)
+            glDisable(GL_BLEND)
+        glPopMatrix()
+
+    def render_transparent(self, x=0, y=0, z=0, scale=1.0, rotation=None):
+        """Render only the blended parts. GL_BLEND must already be enabled."""
+        if not self.display_list_transparent:
+            return
+        glPushMatrix()
+        self._apply_transform(x, y, z, scale, rotation)
+        glCallList(self.display_list_transparent)
         glPopMatrix()
 
     def update(self, dt):
         """Update trophy animation (rotation)."""
-        self.rotation += 45 * dt  # 45 degrees per second
-        if self.rotation >= 360:
-            self.rotation -= 360
+        self.rotation = (self.rotation + 45 * dt) % 360  # 45 degrees per second
 
     def cleanup(self):
-        """Clean up OpenGL resources."""
-        if self.display_list:
-            glDeleteLists(self.display_list, 1)
-            self.display_list = None
+        """Release this trophy's references; the shared display lists stay cached."""
+        self.display_list = None
+        self.display_list_low = None
+        self.display_list_transparent = None
+
+    @classmethod
+    def free_all(cls):
+        """Delete every cached trophy display list, shared sub-lists included."""
+        for display_list in cls._display_lists.values():
+            glDeleteLists(display_list, 1)
+        cls._display_lists.clear()
+        for display_list in cls._low_detail_lists.values():
+            glDeleteLists(display_list, 1)
+        cls._low_detail_lists.clear()
+        for display_list in cls._transparent_lists.values():
+            glDeleteLists(display_list, 1)
+        cls._transparent_lists.clear()
+        for display_list in cls._shared_lists.values():
+            glDeleteLists(display_list, 1)
+        cls._shared_lists.clear()
+
+
+# Planet name -> unbound renderer, resolved once instead of per build
+Trophy._RENDERERS = {
+    name: getattr(Trophy, f'_render_{name.lower()}_trophy')
+    for name in Trophy.TROPHY_COLORS
+}
+
+# Planet name -> renderer for its blended parts, if it has any
+Trophy._TRANSPARENT_RENDERERS = {
+    "Sun": Trophy._render_sun_corona,
+}
 
 
 class TrophyRenderer:
@@ -1095,23 +1077,24 @@ class TrophyRenderer:
     """
 
     def __init__(self):
-        self.trophies = {}  # planet_name -> Trophy
-        self._create_all_trophies()
-
-    def _create_all_trophies(self):
-        """Pre-create all trophy models."""
-        for planet in Trophy.TROPHY_COLORS.keys():
-            self.trophies[planet] = Trophy(planet)
+        self.trophies = {}  # planet_name -> Trophy, created on first use
+        # Snapshot of the trophies for the per-frame update loop
+        self._trophy_list = ()
 
     def get_trophy(self, planet_name):
-        """Get trophy for a specific planet."""
-        return self.trophies.get(planet_name)
+        """Get trophy for a specific planet, building it on first request."""
+        trophy = self.trophies.get(planet_name)
+        if trophy is None and planet_name in Trophy.TROPHY_COLORS:
+            trophy = self.trophies[planet_name] = Trophy(planet_name)
+            self._trophy_list = tuple(self.trophies.values())
+        return trophy
 
-    def render_trophy(self, planet_name, x=0, y=0, z=0, scale=1.0, rotation=None):
+    def render_trophy(self, planet_name, x=0, y=0, z=0, scale=1.0, rotation=None,
+                      low_detail=False):
         """Render a specific planet's trophy."""
-        trophy = self.trophies.get(planet_name)
+        trophy = self.get_trophy(planet_name)
         if trophy:
-            trophy.render(x, y, z, scale, rotation)
+            trophy.render(x, y, z, scale, rotation, low_detail=low_detail)
 
     def render_collection(self, earned_trophies, x_start=0, y=0, z=0, spacing=0.8, scale=0.5):
         """
@@ -1123,17 +1106,33 @@ class TrophyRenderer:
         else:
             planets = list(earned_trophies)
 
+        # Opaque pass first, then every blended part under a single GL_BLEND
+        placed = []
         for i, planet in enumerate(planets):
-            x = x_start + i * spacing
-            self.render_trophy(planet, x, y, z, scale)
+            trophy = self.get_trophy(planet)
+            if trophy:
+                x = x_start + i * spacing
+                trophy.render(x, y, z, scale, transparent=False, low_detail=True)
+                if trophy.display_list_transparent:
+                    placed.append((trophy, x))
+
+        if placed:
+            glEnable(GL_BLEND)
+            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            for trophy, x in placed:
+                trophy.render_transparent(x, y, z, scale)
+            glDisable(GL_BLEND)
 
     def update_all(self, dt):
-        """Update all trophy animations."""
-        for trophy in self.trophies.values():
-            trophy.update(dt)
+        """Update the animations of trophies drawn since the previous update."""
+        for trophy in self._trophy_list:
+            if trophy.visible:
+                trophy.update(dt)
+                trophy.visible = False
 
     def cleanup(self):
         """Clean up all trophy resources."""
         for trophy in self.trophies.values():
             trophy.cleanup()
         self.trophies.clear()
+        self._trophy_list = ()
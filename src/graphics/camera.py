@@ -14,6 +14,10 @@ class Camera:
         self.radius = 30.0
         self.yaw = 0.0
         self.pitch = 30.0
+        # Desplazamiento órbita->cámara, recalculado solo si cambian
+        # yaw/pitch/radius (el target puede moverse libremente)
+        self._orbit_offset = None
+        self._orbit_key = None
 
         # Follow parameters
         self.position = [0.0, 10.0, 20.0]
@@ -30,61 +34,82 @@ class Camera:
             # Posición deseada: Detrás y arriba de la nave
             # Calculamos el vector "atrás" basado en la rotación de la nave
             rad = math.radians(self.follow_target.rotation_y)
+            sin_r = math.sin(rad)
+            cos_r = math.cos(rad)
             offset_dist = 8.0  # Closer to ship
             offset_height = 3.5  # Lower height
 
-            # Nota el doble negativo por la convención -Z
-            desired_x = target_x - (-math.sin(rad) * offset_dist)
-            desired_z = target_z - (-math.cos(rad) * offset_dist)
+            # "Adelante" es (-sin, -cos) por la convención -Z; atrás es (+sin, +cos)
+            desired_x = target_x + sin_r * offset_dist
+            desired_z = target_z + cos_r * offset_dist
             desired_y = target_y + offset_height
 
-            # Interpolación lineal (Lerp) - higher value = tighter follow
-            lerp_factor = self.follow_smoothness * dt
-            self.position[0] += (desired_x - self.position[0]) * lerp_factor
-            self.position[1] += (desired_y - self.position[1]) * lerp_factor
-            self.position[2] += (desired_z - self.position[2]) * lerp_factor
+            # Suavizado exponencial - higher value = tighter follow
+            lerp_factor = self.follow_lerp_factor(dt)
+            self.ease_position(desired_x, desired_y, desired_z, lerp_factor)
 
             # Camera looks slightly ahead of the ship for better forward view
             look_ahead_dist = 3.0  # Reduced - closer to ship
-            look_ahead_x = target_x + (-math.sin(rad) * look_ahead_dist)
-            look_ahead_z = target_z + (-math.cos(rad) * look_ahead_dist)
+            look_ahead_x = target_x - sin_r * look_ahead_dist
+            look_ahead_z = target_z - cos_r * look_ahead_dist
             look_ahead_y = target_y + 0.5  # Just slightly above ship
 
-            self.target = [look_ahead_x, look_ahead_y, look_ahead_z]
+            self.target[:] = (look_ahead_x, look_ahead_y, look_ahead_z)
+
+    def follow_lerp_factor(self, dt):
+        """
+        Factor de interpolación independiente del frame rate:
+        1 - e^(-k·dt), una sola exponencial (≈ k·dt para dt pequeños).
+        """
+        return 1.0 - math.exp(-self.follow_smoothness * dt)
+
+    def ease_position(self, desired_x, desired_y, desired_z, lerp_factor):
+        """Acerca la posición hacia la deseada (in place, una sola lectura)."""
+        position = self.position
+        px, py, pz = position
+        position[0] = px + (desired_x - px) * lerp_factor
+        position[1] = py + (desired_y - py) * lerp_factor
+        position[2] = pz + (desired_z - pz) * lerp_factor
 
     def apply(self):
         """Aplica la matriz de vista (View Matrix) usando gluLookAt."""
         if self.mode == self.MODE_ORBIT:
-            # Convertir coordenadas esféricas a cartesianas
-            rad_yaw = math.radians(self.yaw)
-            rad_pitch = math.radians(self.pitch)
-
-            # Calcular posición de la cámara
-            cam_x = self.target[0] + self.radius * \
-                math.sin(rad_yaw) * math.cos(rad_pitch)
-            cam_y = self.target[1] + self.radius * math.sin(rad_pitch)
-            cam_z = self.target[2] + self.radius * \
-                math.cos(rad_yaw) * math.cos(rad_pitch)
-
-            gluLookAt(cam_x, cam_y, cam_z,
-                      self.target[0], self.target[1], self.target[2],
+            off_x, off_y, off_z = self._get_orbit_offset()
+            tx, ty, tz = self.target
+            gluLookAt(tx + off_x, ty + off_y, tz + off_z,
+                      tx, ty, tz,
                       0, 1, 0)
 
         elif self.mode == self.MODE_FOLLOW:
-            gluLookAt(self.position[0], self.position[1], self.position[2],
-                      self.target[0], self.target[1], self.target[2],
-                      0, 1, 0)
+            gluLookAt(*self.position, *self.target, 0, 1, 0)
+
+    def _get_orbit_offset(self):
+        """
+        Convierte las coordenadas esféricas (yaw, pitch, radius) a un
+        desplazamiento cartesiano desde el target. Cacheado: con la cámara
+        quieta no se evalúa ninguna función trigonométrica.
+        """
+        key = (self.yaw, self.pitch, self.radius)
+        if key != self._orbit_key:
+            rad_yaw = math.radians(self.yaw)
+            rad_pitch = math.radians(self.pitch)
+            horizontal = self.radius * math.cos(rad_pitch)
+            self._orbit_offset = (horizontal * math.sin(rad_yaw),
+                                  self.radius * math.sin(rad_pitch),
+                                  horizontal * math.cos(rad_yaw))
+            self._orbit_key = key
+        return self._orbit_offset
 
     def rotate(self, dx, dy):
         """Rota la cámara en modo órbita."""
         if self.mode == self.MODE_ORBIT:
             self.yaw += dx
-            self.pitch += dy
             # Limitar el pitch para evitar el gimbal lock o inversión
-            self.pitch = max(-89.0, min(89.0, self.pitch))
+            pitch = self.pitch + dy
+            self.pitch = -89.0 if pitch < -89.0 else 89.0 if pitch > 89.0 else pitch
 
     def zoom(self, amount):
         """Acerca o aleja la cámara."""
         if self.mode == self.MODE_ORBIT:
-            self.radius -= amount
-            self.radius = max(5.0, min(200.0, self.radius))
+            radius = self.radius - amount
+            self.radius = 5.0 if radius < 5.0 else 200.0 if radius > 200.0 else radius
@@ -8,6 +8,145 @@ from OpenGL.GLUT import *
 from OpenGL.GLU import *
 import math
 
+# Shared GLU quadric (smooth normals + texture coords), created lazily
+# because a GL context may not exist at import time
+_quadric = None
+
+
+def _get_quadric():
+    """Return the module-wide quadric used by every GLU primitive."""
+    global _quadric
+    if _quadric is None:
+        _quadric = gluNewQuadric()
+        gluQuadricNormals(_quadric, GLU_SMOOTH)
+        gluQuadricTexture(_quadric, GL_TRUE)
+    return _quadric
+
+
+# Display lists of tessellated primitives, keyed by their geometric
+# parameters. Color and material stay outside the list.
+_geometry_lists = {}
+
+
+def _call_geometry_list(key, emit):
+    """
+    Call the cached display list for `key`, compiling it with `emit` on first use.
+
+    glNewList cannot be nested, so while another list is being compiled the
+    geometry is emitted directly into it instead.
+
+    Args:
+        key (tuple): Primitive name plus the parameters that define its geometry
+        emit (callable): Issues the GL calls for the primitive
+    """
+    list_id = _geometry_lists.get(key)
+    if list_id is None:
+        if glGetIntegerv(GL_LIST_INDEX):
+            emit()
+            return
+        list_id = glGenLists(1)
+        glNewList(list_id, GL_COMPILE)
+        emit()
+        glEndList()
+        _geometry_lists[key] = list_id
+    glCallList(list_id)
+
+
+# Display lists that also set the color, for shapes drawn over and over
+# with a small palette. Keyed by (shape, *parameters, color[, shininess]).
+# Lists are never deleted, so other display lists may call them safely;
+# once the cache is full, new pairs are drawn without a list of their own.
+_colored_lists = {}
+_COLORED_LIST_LIMIT = 256
+
+
+def _call_colored_list(key, color, emit, shininess=None):
+    """
+    Call a cached display list that sets `color` and then runs `emit`,
+    so a repeated (shape, color) pair costs a single glCallList.
+
+    Args:
+        key (tuple): Primitive name plus the parameters that define its geometry
+        color (tuple): RGB or RGBA color recorded in the list
+        emit (callable): Issues the GL calls for the primitive
+        shininess (float): If given, the full material is recorded with
+            set_material_color instead of the color alone
+    """
+    key = key + (tuple(color), shininess)
+    list_id = _colored_lists.get(key)
+    if list_id is None:
+        # Full cache, or glNewList cannot be nested: draw without a new list
+        if len(_colored_lists) >= _COLORED_LIST_LIMIT or glGetIntegerv(GL_LIST_INDEX):
+            _set_list_color(color, shininess)
+            emit()
+            return
+        list_id = glGenLists(1)
+        glNewList(list_id, GL_COMPILE)
+        _set_list_color(color, shininess)
+        emit()
+        glEndList()
+        _colored_lists[key] = list_id
+    glCallList(list_id)
+
+
+def _set_list_color(color, shininess):
+    """Color alone, or the full material when a shininess is given."""
+    if shininess is None:
+        _set_color(color)
+    else:
+        set_material_color(color, shininess)
+
+
+def prewarm(shape_specs):
+    """
+    Compile the display lists behind a set of draw calls ahead of time,
+    so the first frame that uses them does not stall on tessellation.
+
+    Each draw runs once with color and depth writes masked off: the caches
+    fill up but nothing reaches the framebuffer. Must be called from the
+    thread that owns the GL context.
+
+    Args:
+        shape_specs (list): (draw_function, kwargs) pairs, e.g.
+            [(draw_capsule, {"radius": 0.5, "height": 2.0})]
+    """
+    glPushAttrib(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+    glColorMask(GL_FALSE, GL_FALSE, GL_FALSE, GL_FALSE)
+    glDepthMask(GL_FALSE)
+    for draw, kwargs in shape_specs:
+        draw(**kwargs)
+    glPopAttrib()
+
+
+def _unit_arc(count, step, start=0):
+    """
+    (cos, sin) pairs for the angles (start + i) * step, i = 0..count.
+
+    Shared trig table for the ring/strip builders: the angle step is
+    computed once by the caller instead of dividing per vertex.
+    """
+    cos, sin = math.cos, math.sin
+    return [(cos((start + i) * step), sin((start + i) * step))
+            for i in range(count + 1)]
+
+
+def _draw_unit_cube():
+    """Unit cube with normals, compiled once and replayed by every box helper."""
+    _call_geometry_list(("cube",), lambda: glutSolidCube(1.0))
+
+
+# glColor entry point by component count (RGB or RGBA)
+_COLOR_FUNCS = {3: glColor3f, 4: glColor4f}
+
+
+def _set_color(color):
+    """Set the current RGB or RGBA color."""
+    _COLOR_FUNCS[len(color)](*color)
+
+
+# Preconverted (s, s, s, 1) GLfloat arrays keyed by specular strength
+_specular_buffers = {}
+
 
 def set_material_color(color, shininess=32.0, specular_strength=0.5):
     """
@@ -20,14 +159,14 @@ def set_material_color(color, shininess=32.0, specular_strength=0.5):
     """
     if color:
         # Set ambient and diffuse (affected by GL_COLOR_MATERIAL)
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
+        _set_color(color)
 
         # Set specular component for Phong highlights
-        specular = (specular_strength, specular_strength,
-                    specular_strength, 1.0)
+        specular = _specular_buffers.get(specular_strength)
+        if specular is None:
+            specular = (GLfloat * 4)(specular_strength, specular_strength,
+                                     specular_strength, 1.0)
+            _specular_buffers[specular_strength] = specular
         glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, specular)
         glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, shininess)
 
@@ -44,15 +183,20 @@ def draw_cube(size=1.0, color=None, shininess=32.0):
         color (tuple): Optional RGB or RGBA color
         shininess (float): Material shininess for specular highlights
     """
-    glPushMatrix()
+    if size <= 0:
+        return
 
-    set_material_color(color, shininess)
+    glPushMatrix()
 
     # Scale to desired size
     glScalef(size, size, size)
 
-    # Draw cube using glutSolidCube for automatic normals
-    glutSolidCube(1.0)
+    # Unit glutSolidCube (automatic normals) replayed from a display list,
+    # with the material recorded alongside it for a given color
+    if color:
+        _call_colored_list(("cube",), color, _draw_unit_cube, shininess)
+    else:
+        _draw_unit_cube()
 
     glPopMatrix()
 
@@ -70,15 +214,17 @@ def draw_sphere(radius=1.0, slices=32, stacks=32, color=None, shininess=32.0):
         color (tuple): Optional RGB or RGBA color
         shininess (float): Material shininess for specular highlights
     """
+    if radius <= 0:
+        return
+
     glPushMatrix()
 
     set_material_color(color, shininess)
 
-    quadric = gluNewQuadric()
-    gluQuadricNormals(quadric, GLU_SMOOTH)
-    gluQuadricTexture(quadric, GL_TRUE)
-    gluSphere(quadric, radius, slices, stacks)
-    gluDeleteQuadric(quadric)
+    def emit():
+        gluSphere(_get_quadric(), radius, slices, stacks)
+
+    _call_geometry_list(("sphere", radius, slices, stacks), emit)
 
     glPopMatrix()
 
@@ -101,34 +247,81 @@ def draw_cylinder(base_radius=1.0, top_radius=1.0, height=1.0,
 
     set_material_color(color, shininess)
 
-    # Rotate so cylinder axis (originally Z) aligns with Y (upright)
-    glRotatef(-90, 1, 0, 0)
+    def emit():
+        # Rotate so cylinder axis (originally Z) aligns with Y (upright)
+        glRotatef(-90, 1, 0, 0)
 
-    # Move to center the cylinder (apply translate before rotation in object space)
-    glTranslatef(0, 0, -height / 2.0)
+        # Move to center the cylinder (apply translate before rotation in object space)
+        glTranslatef(0, 0, -height / 2.0)
 
-    # Draw cylinder body
-    quadric = gluNewQuadric()
-    gluQuadricNormals(quadric, GLU_SMOOTH)
-    gluQuadricTexture(quadric, GL_TRUE)
-    gluCylinder(quadric, base_radius, top_radius, height, slices, stacks)
+        # Draw cylinder body
+        quadric = _get_quadric()
+        gluCylinder(quadric, base_radius, top_radius, height, slices, stacks)
 
-    # Draw bottom cap (at z=0 before rotation)
-    glPushMatrix()
-    glRotatef(180, 1, 0, 0)
-    gluDisk(quadric, 0, base_radius, slices, 1)
-    glPopMatrix()
+        # Draw bottom cap (at z=0 before rotation)
+        glPushMatrix()
+        glRotatef(180, 1, 0, 0)
+        gluDisk(quadric, 0, base_radius, slices, 1)
+        glPopMatrix()
 
-    # Draw top cap (at z=height before rotation)
-    glPushMatrix()
-    glTranslatef(0, 0, height)
-    gluDisk(quadric, 0, top_radius, slices, 1)
-    glPopMatrix()
+        # Draw top cap (at z=height before rotation)
+        glPushMatrix()
+        glTranslatef(0, 0, height)
+        gluDisk(quadric, 0, top_radius, slices, 1)
+        glPopMatrix()
+
+    _call_geometry_list(
+        ("cylinder", base_radius, top_radius, height, slices, stacks), emit)
 
-    gluDeleteQuadric(quadric)
     glPopMatrix()
 
 
+def draw_lathe(profile, slices=32, colors=None, shininess=32.0):
+    """
+    Draw a surface of revolution around the Y axis from a 2D profile.
+
+    Each profile segment becomes one triangle strip band with its own
+    normal along the profile (hard edges between segments, smooth around
+    the axis), so several stacked cylinders/discs can be drawn as a
+    single mesh without their hidden caps.
+
+    Args:
+        profile (list): (radius, y) points, ordered so the outside of the
+                        surface is on the right when walking the profile
+                        (e.g. bottom center -> outer edge -> top center)
+        slices (int): Number of subdivisions around the axis
+        colors (list): Optional RGB color per segment (len(profile) - 1)
+        shininess (float): Material shininess for specular highlights
+    """
+    if colors:
+        set_material_color(colors[0], shininess)
+
+    ring = _unit_arc(slices, 2 * math.pi / slices)
+
+    for k in range(len(profile) - 1):
+        if colors and k > 0 and colors[k] != colors[k - 1]:
+            glColor3f(*colors[k])
+
+        r0, y0 = profile[k]
+        r1, y1 = profile[k + 1]
+
+        # Outward normal of the segment in the (radius, y) plane
+        dr = r1 - r0
+        dy = y1 - y0
+        length = math.sqrt(dr * dr + dy * dy)
+        if length == 0:
+            continue
+        nr = dy / length
+        ny = -dr / length
+
+        glBegin(GL_TRIANGLE_STRIP)
+        for c, s in ring:
+            glNormal3f(nr * c, ny, nr * s)
+            glVertex3f(r0 * c, y0, r0 * s)
+            glVertex3f(r1 * c, y1, r1 * s)
+        glEnd()
+
+
 def draw_cone(base_radius=1.0, height=1.0, slices=32, stacks=1, color=None):
     """
     Draw a cone along the Z axis, with base centered at origin.
@@ -153,28 +346,23 @@ def draw_plane(width=1.0, height=1.0, color=None, normal=(0, 1, 0)):
         color (tuple): Optional RGB or RGBA color
         normal (tuple): Normal vector for lighting (default: up)
     """
-    glPushMatrix()
-
     if color:
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
+        _set_color(color)
 
-    # Draw plane as a quad
+    # Draw plane as two triangles
     w = width / 2.0
     h = height / 2.0
 
-    glBegin(GL_QUADS)
+    glBegin(GL_TRIANGLES)
     glNormal3f(*normal)
     glVertex3f(-w, 0, -h)
     glVertex3f(w, 0, -h)
     glVertex3f(w, 0, h)
+    glVertex3f(-w, 0, -h)
+    glVertex3f(w, 0, h)
     glVertex3f(-w, 0, h)
     glEnd()
 
-    glPopMatrix()
-
 
 def draw_torus(inner_radius=0.5, outer_radius=1.0, sides=32, rings=32, color=None):
     """
@@ -187,17 +375,16 @@ def draw_torus(inner_radius=0.5, outer_radius=1.0, sides=32, rings=32, color=Non
         rings (int): Number of rings
         color (tuple): Optional RGB or RGBA color
     """
-    glPushMatrix()
-
-    if color:
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
+    key = ("torus", inner_radius, outer_radius, sides, rings)
 
-    glutSolidTorus(inner_radius, outer_radius, sides, rings)
+    def emit():
+        _call_geometry_list(
+            key, lambda: glutSolidTorus(inner_radius, outer_radius, sides, rings))
 
-    glPopMatrix()
+    if color:
+        _call_colored_list(key, color, emit)
+    else:
+        emit()
 
 
 def draw_teapot(size=1.0, color=None):
@@ -208,17 +395,15 @@ def draw_teapot(size=1.0, color=None):
         size (float): Size of the teapot
         color (tuple): Optional RGB or RGBA color
     """
-    glPushMatrix()
+    key = ("teapot", size)
 
-    if color:
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
-
-    glutSolidTeapot(size)
+    def emit():
+        _call_geometry_list(key, lambda: glutSolidTeapot(size))
 
-    glPopMatrix()
+    if color:
+        _call_colored_list(key, color, emit)
+    else:
+        emit()
 
 
 def draw_capsule(radius=0.5, height=2.0, slices=32, stacks=16, color=None):
@@ -233,47 +418,98 @@ def draw_capsule(radius=0.5, height=2.0, slices=32, stacks=16, color=None):
         stacks (int): Number of subdivisions for spheres
         color (tuple): Optional RGB or RGBA color
     """
+    if radius <= 0:
+        return
+
     glPushMatrix()
 
     if color:
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
+        _set_color(color)
 
     cylinder_height = max(0, height - 2 * radius)
 
-    # Bottom hemisphere
-    glPushMatrix()
-    glTranslatef(0, -cylinder_height / 2.0, 0)
-    glRotatef(-90, 1, 0, 0)
-    quadric = gluNewQuadric()
-    gluQuadricNormals(quadric, GLU_SMOOTH)
-    gluSphere(quadric, radius, slices, stacks // 2)
-    gluDeleteQuadric(quadric)
-    glPopMatrix()
+    def emit():
+        # One surface of revolution: bottom hemisphere, straight band and
+        # top hemisphere share their equator rings, so the halves of the
+        # end spheres that used to sit hidden inside the cylinder are gone
+        bands = max(2, stacks // 2)
+        ring = _unit_arc(slices, 2 * math.pi / slices)
+        lat_step = 0.5 * math.pi / bands
+        profile = [(cos_lat, sin_lat, -cylinder_height / 2.0)
+                   for cos_lat, sin_lat in _unit_arc(bands, lat_step, -bands)]
+        top = _unit_arc(bands, lat_step)
+        if cylinder_height == 0:
+            # No straight band: the hemispheres meet at one equator ring
+            top = top[1:]
+        profile += [(cos_lat, sin_lat, cylinder_height / 2.0)
+                    for cos_lat, sin_lat in top]
+
+        for (cos0, sin0, y0), (cos1, sin1, y1) in zip(profile, profile[1:]):
+            r0 = radius * cos0
+            r1 = radius * cos1
+            y0 += radius * sin0
+            y1 += radius * sin1
+            glBegin(GL_TRIANGLE_STRIP)
+            for c, s in ring:
+                glNormal3f(cos0 * c, sin0, cos0 * s)
+                glVertex3f(r0 * c, y0, r0 * s)
+                glNormal3f(cos1 * c, sin1, cos1 * s)
+                glVertex3f(r1 * c, y1, r1 * s)
+            glEnd()
+
+    _call_geometry_list(("capsule", radius, height, slices, stacks), emit)
 
-    # Middle cylinder
-    glPushMatrix()
-    glRotatef(-90, 1, 0, 0)
-    glTranslatef(0, 0, -cylinder_height / 2.0)
-    quadric = gluNewQuadric()
-    gluQuadricNormals(quadric, GLU_SMOOTH)
-    gluCylinder(quadric, radius, radius, cylinder_height, slices, 1)
-    gluDeleteQuadric(quadric)
     glPopMatrix()
 
-    # Top hemisphere
-    glPushMatrix()
-    glTranslatef(0, cylinder_height / 2.0, 0)
-    glRotatef(-90, 1, 0, 0)
-    quadric = gluNewQuadric()
-    gluQuadricNormals(quadric, GLU_SMOOTH)
-    gluSphere(quadric, radius, slices, stacks // 2)
-    gluDeleteQuadric(quadric)
-    glPopMatrix()
 
-    glPopMatrix()
+def _draw_grid_geometry(size, spacing, color):
+    """Grid color and cached lines, without touching the lighting state."""
+    if color:
+        _set_color(color)
+    else:
+        glColor3f(0.3, 0.3, 0.3)  # Default gray
+
+    def emit():
+        half_size = (size * spacing) / 2.0
+
+        coords = []
+        for i in range(size + 1):
+            offset = i * spacing - half_size
+            # Lines parallel to X axis, then lines parallel to Z axis
+            coords += (-half_size, 0.0, offset, half_size, 0.0, offset,
+                       offset, 0.0, -half_size, offset, 0.0, half_size)
+
+        # One array submission instead of a glVertex3f call per endpoint
+        vertices = (GLfloat * len(coords))(*coords)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, vertices)
+        glDrawArrays(GL_LINES, 0, len(coords) // 3)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+    _call_geometry_list(("grid", size, spacing), emit)
+
+
+def _draw_axes_geometry(length):
+    """Cached colored axis lines, without touching the lighting state."""
+    def emit():
+        glBegin(GL_LINES)
+        # X axis - Red
+        glColor3f(1, 0, 0)
+        glVertex3f(0, 0, 0)
+        glVertex3f(length, 0, 0)
+
+        # Y axis - Green
+        glColor3f(0, 1, 0)
+        glVertex3f(0, 0, 0)
+        glVertex3f(0, length, 0)
+
+        # Z axis - Blue
+        glColor3f(0, 0, 1)
+        glVertex3f(0, 0, 0)
+        glVertex3f(0, 0, length)
+        glEnd()
+
+    _call_geometry_list(("axes", length), emit)
 
 
 def draw_grid(size=10, spacing=1.0, color=None):
@@ -285,36 +521,13 @@ def draw_grid(size=10, spacing=1.0, color=None):
         spacing (float): Distance between grid lines
         color (tuple): Optional RGB or RGBA color
     """
-    glPushMatrix()
-
-    if color:
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
-    else:
-        glColor3f(0.3, 0.3, 0.3)  # Default gray
-
-    # Disable lighting for grid
+    # Disable lighting for grid; the caller's enable state is restored after
+    glPushAttrib(GL_ENABLE_BIT)
     glDisable(GL_LIGHTING)
 
-    half_size = (size * spacing) / 2.0
-
-    glBegin(GL_LINES)
-    for i in range(size + 1):
-        offset = i * spacing - half_size
-        # Lines parallel to X axis
-        glVertex3f(-half_size, 0, offset)
-        glVertex3f(half_size, 0, offset)
-        # Lines parallel to Z axis
-        glVertex3f(offset, 0, -half_size)
-        glVertex3f(offset, 0, half_size)
-    glEnd()
-
-    # Re-enable lighting
-    glEnable(GL_LIGHTING)
+    _draw_grid_geometry(size, spacing, color)
 
-    glPopMatrix()
+    glPopAttrib()
 
 
 def draw_axes(length=1.0):
@@ -325,32 +538,35 @@ def draw_axes(length=1.0):
     Args:
         length (float): Length of each axis
     """
-    glPushMatrix()
-
-    # Disable lighting for axes
+    # Disable lighting for axes; the caller's enable state is restored after
+    glPushAttrib(GL_ENABLE_BIT)
     glDisable(GL_LIGHTING)
 
-    glBegin(GL_LINES)
-    # X axis - Red
-    glColor3f(1, 0, 0)
-    glVertex3f(0, 0, 0)
-    glVertex3f(length, 0, 0)
-
-    # Y axis - Green
-    glColor3f(0, 1, 0)
-    glVertex3f(0, 0, 0)
-    glVertex3f(0, length, 0)
-
-    # Z axis - Blue
-    glColor3f(0, 0, 1)
-    glVertex3f(0, 0, 0)
-    glVertex3f(0, 0, length)
-    glEnd()
+    _draw_axes_geometry(length)
 
-    # Re-enable lighting
-    glEnable(GL_LIGHTING)
+    glPopAttrib()
 
-    glPopMatrix()
+
+def draw_debug_overlay(grid_size=10, spacing=1.0, axes_length=1.0, grid_color=None):
+    """
+    Draw the reference grid and the coordinate axes together, switching
+    lighting off once for both instead of once per helper.
+
+    The previous GL_LIGHTING state is restored afterwards.
+
+    Args:
+        grid_size (int): Number of grid lines in each direction
+        spacing (float): Distance between grid lines
+        axes_length (float): Length of each axis
+        grid_color (tuple): Optional RGB or RGBA grid color
+    """
+    glPushAttrib(GL_ENABLE_BIT)
+    glDisable(GL_LIGHTING)
+
+    _draw_grid_geometry(grid_size, spacing, grid_color)
+    _draw_axes_geometry(axes_length)
+
+    glPopAttrib()
 
 
 def draw_rectangle(width=1.0, height=1.0, depth=0.1, color=None):
@@ -367,13 +583,10 @@ def draw_rectangle(width=1.0, height=1.0, depth=0.1, color=None):
     glPushMatrix()
 
     if color:
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
+        _set_color(color)
 
     glScalef(width, height, depth)
-    glutSolidCube(1.0)
+    _draw_unit_cube()
 
     glPopMatrix()
 
@@ -393,61 +606,49 @@ def draw_half_sphere(radius=1.0, slices=40, stacks=20, upper=True, closed=True,
     glPushMatrix()
 
     if color:
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
+        _set_color(color)
 
     glScalef(radius, radius, radius)
 
-    # Draw hemisphere using triangle strips
-    for i in range(stacks):
-        lat0 = (math.pi * 0.5 * i) / \
-            stacks if upper else (math.pi * 0.5 * (i - stacks)) / stacks
-        lat1 = (math.pi * 0.5 * (i + 1)) / \
-            stacks if upper else (math.pi * 0.5 * (i + 1 - stacks)) / stacks
-
-        glBegin(GL_TRIANGLE_STRIP)
-        for j in range(slices + 1):
-            lng = 2 * math.pi * j / slices
-
-            # First vertex
-            x0 = math.cos(lat0) * math.cos(lng)
-            y0 = math.sin(lat0)
-            z0 = math.cos(lat0) * math.sin(lng)
-            glNormal3f(x0, y0, z0)
-            glVertex3f(x0, y0, z0)
-
-            # Second vertex
-            x1 = math.cos(lat1) * math.cos(lng)
-            y1 = math.sin(lat1)
-            z1 = math.cos(lat1) * math.sin(lng)
-            glNormal3f(x1, y1, z1)
-            glVertex3f(x1, y1, z1)
-        glEnd()
-
-    # Draw flat base to close the hemisphere if requested
-    if closed:
-        glBegin(GL_TRIANGLE_FAN)
-        # Normal pointing DOWN for upper hemisphere, UP for lower hemisphere
-        glNormal3f(0, -1 if upper else 1, 0)
-        # Center point
-        glVertex3f(0, 0, 0)
-        # Outer rim - need to reverse winding order for lower hemisphere
-        if upper:
-            for j in range(slices + 1):
-                lng = 2 * math.pi * j / slices
-                x = math.cos(lng)
-                z = math.sin(lng)
-                glVertex3f(x, 0, z)
-        else:
-            # Reverse winding for lower hemisphere so normal faces outward
-            for j in range(slices, -1, -1):
-                lng = 2 * math.pi * j / slices
-                x = math.cos(lng)
-                z = math.sin(lng)
-                glVertex3f(x, 0, z)
-        glEnd()
+    def emit():
+        # Trig tables: one (cos, sin) per longitude and per latitude ring
+        ring = _unit_arc(slices, 2 * math.pi / slices)
+        lats = _unit_arc(stacks, 0.5 * math.pi / stacks, 0 if upper else -stacks)
+
+        # Draw hemisphere using triangle strips
+        for i in range(stacks):
+            cos_lat0, y0 = lats[i]
+            cos_lat1, y1 = lats[i + 1]
+
+            glBegin(GL_TRIANGLE_STRIP)
+            for c, s in ring:
+                # First vertex
+                x0 = cos_lat0 * c
+                z0 = cos_lat0 * s
+                glNormal3f(x0, y0, z0)
+                glVertex3f(x0, y0, z0)
+
+                # Second vertex
+                x1 = cos_lat1 * c
+                z1 = cos_lat1 * s
+                glNormal3f(x1, y1, z1)
+                glVertex3f(x1, y1, z1)
+            glEnd()
+
+        # Draw flat base to close the hemisphere if requested
+        if closed:
+            glBegin(GL_TRIANGLE_FAN)
+            # Normal pointing DOWN for upper hemisphere, UP for lower hemisphere
+            glNormal3f(0, -1 if upper else 1, 0)
+            # Center point
+            glVertex3f(0, 0, 0)
+            # Outer rim - need to reverse winding order for lower hemisphere
+            # (reversed for the lower hemisphere so the normal faces outward)
+            for c, s in (ring if upper else reversed(ring)):
+                glVertex3f(c, 0, s)
+            glEnd()
+
+    _call_geometry_list(("half_sphere", slices, stacks, upper, closed), emit)
 
     glPopMatrix()
 
@@ -467,75 +668,44 @@ def draw_half_torus(inner_radius=0.5, outer_radius=1.0, sides=16, rings=16, uppe
     glPushMatrix()
 
     if color:
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
-
-    # Calculate the tube radius
-    tube_radius = (outer_radius - inner_radius) / 2.0
-    center_radius = inner_radius + tube_radius
-
-    # Draw the curved surface using quad strips
-    for i in range(rings):
-        angle1 = math.pi * i / \
-            rings if upper else math.pi * (i + rings) / rings
-        angle2 = math.pi * \
-            (i + 1) / rings if upper else math.pi * (i + 1 + rings) / rings
-
-        glBegin(GL_QUAD_STRIP)
-        for j in range(sides + 1):
-            tube_angle = 2.0 * math.pi * j / sides
-
-            # First ring
-            cos_tube1 = math.cos(tube_angle)
-            sin_tube1 = math.sin(tube_angle)
-            x1 = (center_radius + tube_radius * cos_tube1) * math.cos(angle1)
-            y1 = tube_radius * sin_tube1
-            z1 = (center_radius + tube_radius * cos_tube1) * math.sin(angle1)
-            glVertex3f(x1, y1, z1)
-
-            # Second ring
-            x2 = (center_radius + tube_radius * cos_tube1) * math.cos(angle2)
-            y2 = tube_radius * sin_tube1
-            z2 = (center_radius + tube_radius * cos_tube1) * math.sin(angle2)
-            glVertex3f(x2, y2, z2)
-        glEnd()
-
-    # Draw end caps to close the half torus
-    # Left end cap (at angle 0 or pi)
-    cap_angle = 0.0 if upper else math.pi
-    glBegin(GL_TRIANGLE_FAN)
-    # Center point
-    x_center = center_radius * math.cos(cap_angle)
-    z_center = center_radius * math.sin(cap_angle)
-    glVertex3f(x_center, 0, z_center)
-    # Circle around the tube
-    for j in range(sides + 1):
-        tube_angle = 2.0 * math.pi * j / sides
-        cos_tube = math.cos(tube_angle)
-        sin_tube = math.sin(tube_angle)
-        x = (center_radius + tube_radius * cos_tube) * math.cos(cap_angle)
-        y = tube_radius * sin_tube
-        z = (center_radius + tube_radius * cos_tube) * math.sin(cap_angle)
-        glVertex3f(x, y, z)
-    glEnd()
-
-    # Right end cap (at angle pi or 2*pi)
-    cap_angle = math.pi if upper else 2.0 * math.pi
-    glBegin(GL_TRIANGLE_FAN)
-    x_center = center_radius * math.cos(cap_angle)
-    z_center = center_radius * math.sin(cap_angle)
-    glVertex3f(x_center, 0, z_center)
-    for j in range(sides + 1):
-        tube_angle = 2.0 * math.pi * j / sides
-        cos_tube = math.cos(tube_angle)
-        sin_tube = math.sin(tube_angle)
-        x = (center_radius + tube_radius * cos_tube) * math.cos(cap_angle)
-        y = tube_radius * sin_tube
-        z = (center_radius + tube_radius * cos_tube) * math.sin(cap_angle)
-        glVertex3f(x, y, z)
-    glEnd()
+        _set_color(color)
+
+    def emit():
+        # Calculate the tube radius
+        tube_radius = (outer_radius - inner_radius) / 2.0
+        center_radius = inner_radius + tube_radius
+
+        # Trig tables: tube cross-section as (distance from Y axis, y) per
+        # side, and (cos, sin) of each sweep angle around the torus
+        tube = [(center_radius + tube_radius * c, tube_radius * s)
+                for c, s in _unit_arc(sides, 2.0 * math.pi / sides)]
+        sweep = _unit_arc(rings, math.pi / rings, 0 if upper else rings)
+
+        # Draw the curved surface using quad strips
+        for i in range(rings):
+            cos1, sin1 = sweep[i]
+            cos2, sin2 = sweep[i + 1]
+
+            glBegin(GL_QUAD_STRIP)
+            for r, y in tube:
+                # First ring
+                glVertex3f(r * cos1, y, r * sin1)
+                # Second ring
+                glVertex3f(r * cos2, y, r * sin2)
+            glEnd()
+
+        # Draw end caps to close the half torus, at the first sweep angle
+        # (0 or pi) and the last one (pi or 2*pi)
+        for cap_cos, cap_sin in (sweep[0], sweep[rings]):
+            glBegin(GL_TRIANGLE_FAN)
+            # Center point
+            glVertex3f(center_radius * cap_cos, 0, center_radius * cap_sin)
+            # Circle around the tube
+            for r, y in tube:
+                glVertex3f(r * cap_cos, y, r * cap_sin)
+            glEnd()
+
+    _call_geometry_list(("half_torus", inner_radius, outer_radius, sides, rings, upper), emit)
 
     glPopMatrix()
 
@@ -555,86 +725,58 @@ def draw_crescent_moon(outer_radius=1.0, inner_radius=0.7, offset=0.3, segments=
     glPushMatrix()
 
     if color:
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
-
-    half_depth = depth / 2.0
-
-    # Draw front face
-    glBegin(GL_TRIANGLE_STRIP)
-    for i in range(segments + 1):
-        angle = math.pi * i / segments  # 0 to 180 degrees
-
-        # Outer arc point
-        x_outer = outer_radius * math.cos(angle)
-        y_outer = outer_radius * math.sin(angle)
+        _set_color(color)
+
+    def emit():
+        half_depth = depth / 2.0
+
+        # Outer and inner arc points, one (cos, sin) evaluation per segment
+        arc = _unit_arc(segments, math.pi / segments)  # 0 to 180 degrees
+        outer = [(outer_radius * c, outer_radius * s) for c, s in arc]
+        # Inner arc is offset to create the crescent
+        inner = [(inner_radius * c, inner_radius * s + offset) for c, s in arc]
+
+        # Draw front and back faces
+        for z in (half_depth, -half_depth):
+            glBegin(GL_TRIANGLE_STRIP)
+            for (x_outer, y_outer), (x_inner, y_inner) in zip(outer, inner):
+                glVertex3f(x_outer, y_outer, z)
+                glVertex3f(x_inner, y_inner, z)
+            glEnd()
+
+        # Draw outer and inner edges (connecting front and back arcs)
+        for edge in (outer, inner):
+            glBegin(GL_TRIANGLE_STRIP)
+            for x, y in edge:
+                glVertex3f(x, y, half_depth)
+                glVertex3f(x, y, -half_depth)
+            glEnd()
+
+        # Draw left end cap (at angle 0)
+        glBegin(GL_TRIANGLE_STRIP)
+        x_outer = outer_radius
+        y_outer = 0
+        x_inner = inner_radius
+        y_inner = offset
         glVertex3f(x_outer, y_outer, half_depth)
-
-        # Inner arc point (offset to create crescent)
-        x_inner = inner_radius * math.cos(angle)
-        y_inner = inner_radius * math.sin(angle) + offset
+        glVertex3f(x_outer, y_outer, -half_depth)
         glVertex3f(x_inner, y_inner, half_depth)
-    glEnd()
-
-    # Draw back face
-    glBegin(GL_TRIANGLE_STRIP)
-    for i in range(segments + 1):
-        angle = math.pi * i / segments
+        glVertex3f(x_inner, y_inner, -half_depth)
+        glEnd()
 
-        x_outer = outer_radius * math.cos(angle)
-        y_outer = outer_radius * math.sin(angle)
+        # Draw right end cap (at angle pi)
+        glBegin(GL_TRIANGLE_STRIP)
+        x_outer = -outer_radius
+        y_outer = 0
+        x_inner = -inner_radius
+        y_inner = offset
+        glVertex3f(x_outer, y_outer, half_depth)
         glVertex3f(x_outer, y_outer, -half_depth)
-
-        x_inner = inner_radius * math.cos(angle)
-        y_inner = inner_radius * math.sin(angle) + offset
+        glVertex3f(x_inner, y_inner, half_depth)
         glVertex3f(x_inner, y_inner, -half_depth)
-    glEnd()
-
-    # Draw outer edge (connecting front and back outer arcs)
-    glBegin(GL_TRIANGLE_STRIP)
-    for i in range(segments + 1):
-        angle = math.pi * i / segments
-        x = outer_radius * math.cos(angle)
-        y = outer_radius * math.sin(angle)
-        glVertex3f(x, y, half_depth)
-        glVertex3f(x, y, -half_depth)
-    glEnd()
-
-    # Draw inner edge (connecting front and back inner arcs)
-    glBegin(GL_TRIANGLE_STRIP)
-    for i in range(segments + 1):
-        angle = math.pi * i / segments
-        x = inner_radius * math.cos(angle)
-        y = inner_radius * math.sin(angle) + offset
-        glVertex3f(x, y, half_depth)
-        glVertex3f(x, y, -half_depth)
-    glEnd()
-
-    # Draw left end cap (at angle 0)
-    glBegin(GL_TRIANGLE_STRIP)
-    x_outer = outer_radius
-    y_outer = 0
-    x_inner = inner_radius
-    y_inner = offset
-    glVertex3f(x_outer, y_outer, half_depth)
-    glVertex3f(x_outer, y_outer, -half_depth)
-    glVertex3f(x_inner, y_inner, half_depth)
-    glVertex3f(x_inner, y_inner, -half_depth)
-    glEnd()
+        glEnd()
 
-    # Draw right end cap (at angle pi)
-    glBegin(GL_TRIANGLE_STRIP)
-    x_outer = -outer_radius
-    y_outer = 0
-    x_inner = -inner_radius
-    y_inner = offset
-    glVertex3f(x_outer, y_outer, half_depth)
-    glVertex3f(x_outer, y_outer, -half_depth)
-    glVertex3f(x_inner, y_inner, half_depth)
-    glVertex3f(x_inner, y_inner, -half_depth)
-    glEnd()
+    _call_geometry_list(("crescent_moon", outer_radius, inner_radius, offset, segments, depth), emit)
 
     glPopMatrix()
 
@@ -651,20 +793,30 @@ def draw_platform(width=1.0, height=1.0, depth=1.0, color=None):
     """
     glPushMatrix()
 
-    if color:
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
-    else:
-        glColor3f(0.4, 0.6, 0.3)  # Default greenish platform color
-
     glScalef(width, height, depth)
-    glutSolidCube(1.0)
+    # Default greenish platform color
+    _call_colored_list(("cube",), color or (0.4, 0.6, 0.3), _draw_unit_cube)
 
     glPopMatrix()
 
 
+# Unit skybox faces as (name, six triangle vertices); each quad
+# (v0, v1, v2, v3) is split into (v0, v1, v2) and (v0, v2, v3)
+_SKYBOX_FACES = tuple(
+    (face, (v0, v1, v2, v0, v2, v3))
+    for face, (v0, v1, v2, v3) in (
+        # Bottom (darker)
+        ('bottom', ((-1, -1, -1), (1, -1, -1), (1, -1, 1), (-1, -1, 1))),
+        # Top (sky blue)
+        ('top', ((-1, 1, -1), (-1, 1, 1), (1, 1, 1), (1, 1, -1))),
+        ('front', ((-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1))),
+        ('back', ((-1, -1, -1), (-1, 1, -1), (1, 1, -1), (1, -1, -1))),
+        ('left', ((-1, -1, -1), (-1, -1, 1), (-1, 1, 1), (-1, 1, -1))),
+        ('right', ((1, -1, -1), (1, 1, -1), (1, 1, 1), (1, -1, 1))),
+    )
+)
+
+
 def draw_skybox(size=50.0, colors=None):
     """
     Draw a simple colored skybox.
@@ -674,9 +826,8 @@ def draw_skybox(size=50.0, colors=None):
         colors (dict): Optional dictionary with face colors
                       Keys: 'bottom', 'top', 'front', 'back', 'left', 'right'
     """
-    glPushMatrix()
-
-    # Disable lighting for skybox
+    # Disable lighting for skybox; the caller's enable state is restored after
+    glPushAttrib(GL_ENABLE_BIT)
     glDisable(GL_LIGHTING)
     # Disable depth test so skybox is always in background
     glDisable(GL_DEPTH_TEST)
@@ -694,35 +845,103 @@ def draw_skybox(size=50.0, colors=None):
     if colors:
         default_colors.update(colors)
 
-    # Draw each face with different colors
-    faces = [
-        # Bottom (darker)
-        ([(-1, -1, -1), (1, -1, -1), (1, -1, 1),
-         (-1, -1, 1)], default_colors['bottom']),
-        # Top (sky blue)
-        ([(-1, 1, -1), (-1, 1, 1), (1, 1, 1), (1, 1, -1)], default_colors['top']),
-        # Front
-        ([(-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1)], default_colors['front']),
-        # Back
-        ([(-1, -1, -1), (-1, 1, -1), (1, 1, -1), (1, -1, -1)], default_colors['back']),
-        # Left
-        ([(-1, -1, -1), (-1, -1, 1), (-1, 1, 1), (-1, 1, -1)], default_colors['left']),
-        # Right
-        ([(1, -1, -1), (1, 1, -1), (1, 1, 1), (1, -1, 1)], default_colors['right']),
-    ]
-
-    glBegin(GL_QUADS)
-    for vertices, color in faces:
-        glColor3f(*color)
-        for x, y, z in vertices:
-            glVertex3f(x * size, y * size, z * size)
-    glEnd()
+    def emit():
+        # Draw each face with its own color, two triangles per face
+        glBegin(GL_TRIANGLES)
+        for face, vertices in _SKYBOX_FACES:
+            glColor3f(*default_colors[face])
+            for x, y, z in vertices:
+                glVertex3f(x * size, y * size, z * size)
+        glEnd()
 
-    # Re-enable depth test and lighting
-    glEnable(GL_DEPTH_TEST)
-    glEnable(GL_LIGHTING)
+    face_colors = tuple(tuple(default_colors[face]) for face, _ in _SKYBOX_FACES)
+    _call_geometry_list(("skybox", size, face_colors), emit)
 
-    glPopMatrix()
+    glPopAttrib()
+
+
+def _emit_helix_tube(helix_radius, y_start, height, turns, segments,
+                     tube_radius_at, sides):
+    """
+    Emit a closed tube swept along a helix around the Y axis.
+
+    The cross-section rings share vertices between neighbouring segments,
+    so the whole tube is one triangle strip per segment plus two end caps
+    instead of a separate capped cylinder per segment.
+
+    Args:
+        helix_radius (float): Distance from the Y axis to the tube center
+        y_start (float): Height of the first ring
+        height (float): Vertical rise over the whole helix
+        turns (float): Number of complete rotations
+        segments (int): Number of rings - 1 along the helix
+        tube_radius_at (callable): Tube radius for t in [0, 1]
+        sides (int): Subdivisions around the tube
+    """
+    sweep = 2 * math.pi * turns
+    if height == 0 and helix_radius * sweep == 0:
+        return
+
+    section = _unit_arc(sides, 2 * math.pi / sides)
+
+    # A helix has constant speed, so the unit tangent is
+    # (-sin a * swirl, rise, cos a * swirl) with both factors fixed
+    inv_len = 1.0 / math.hypot(helix_radius * sweep, height)
+    swirl = helix_radius * sweep * inv_len
+    rise = height * inv_len
+
+    inv_segments = 1.0 / segments
+    rings = []
+    centers = []
+    tangents = []
+    for i, (cos_a, sin_a) in enumerate(_unit_arc(segments, sweep * inv_segments)):
+        t = i * inv_segments
+        cx = helix_radius * cos_a
+        cy = y_start + height * t
+        cz = helix_radius * sin_a
+        centers.append((cx, cy, cz))
+
+        # Unit tangent (derivative of the helix in t)
+        tx = -swirl * sin_a
+        ty = rise
+        tz = swirl * cos_a
+        tangents.append((tx, ty, tz))
+
+        # Frame: n points at the axis (always perpendicular to the tangent),
+        # b = n x t so the strips below wind counter-clockwise outward
+        nx, nz = -cos_a, -sin_a
+        bx = -nz * ty
+        by = nz * tx - nx * tz
+        bz = nx * ty
+
+        r = tube_radius_at(t)
+        ring = []
+        for c, s in section:
+            dx = c * nx + s * bx
+            dy = s * by
+            dz = c * nz + s * bz
+            ring.append((dx, dy, dz, cx + r * dx, cy + r * dy, cz + r * dz))
+        rings.append(ring)
+
+    for ring0, ring1 in zip(rings, rings[1:]):
+        glBegin(GL_TRIANGLE_STRIP)
+        for v0, v1 in zip(ring0, ring1):
+            glNormal3f(v0[0], v0[1], v0[2])
+            glVertex3f(v0[3], v0[4], v0[5])
+            glNormal3f(v1[0], v1[1], v1[2])
+            glVertex3f(v1[3], v1[4], v1[5])
+        glEnd()
+
+    # End caps: the start faces back along the tangent, the end forward
+    for i, sign in ((0, -1.0), (segments, 1.0)):
+        tx, ty, tz = tangents[i]
+        ring = rings[i]
+        glBegin(GL_TRIANGLE_FAN)
+        glNormal3f(sign * tx, sign * ty, sign * tz)
+        glVertex3f(*centers[i])
+        for v in (ring if sign < 0 else reversed(ring)):
+            glVertex3f(v[3], v[4], v[5])
+        glEnd()
 
 
 def draw_spiral(radius=0.5, height=2.0, turns=2.5, tube_radius=0.15, segments=64, color=None):
@@ -744,78 +963,14 @@ def draw_spiral(radius=0.5, height=2.0, turns=2.5, tube_radius=0.15, segments=64
     glPushMatrix()
 
     if color:
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
-
-    # Create quadric for the tube segments
-    quadric = gluNewQuadric()
-    gluQuadricNormals(quadric, GLU_SMOOTH)
-
-    # Draw the spiral as a series of small cylinder segments
-    steps = segments
-    for i in range(steps):
-        t = i / float(steps)  # 0 to 1
-
-        # Calculate position along spiral
-        angle = 2 * math.pi * turns * t
-        y = -height/2 + height * t
-        x = radius * math.cos(angle)
-        z = radius * math.sin(angle)
-
-        # Calculate next position for orientation
-        t_next = (i + 1) / float(steps)
-        angle_next = 2 * math.pi * turns * t_next
-        y_next = -height/2 + height * t_next
-        x_next = radius * math.cos(angle_next)
-        z_next = radius * math.sin(angle_next)
-
-        # Direction vector
-        dx = x_next - x
-        dy = y_next - y
-        dz = z_next - z
-        segment_length = math.sqrt(dx*dx + dy*dy + dz*dz)
-
-        if segment_length > 0:
-            glPushMatrix()
-
-            # Move to current position
-            glTranslatef(x, y, z)
-
-            # Calculate rotation to align cylinder with direction
-            # Default cylinder is along Z axis, need to rotate to point along (dx, dy, dz)
-            length_xz = math.sqrt(dx*dx + dz*dz)
-            if length_xz > 0:
-                # Rotate around Y axis to point in XZ direction
-                angle_y = math.atan2(dx, dz) * 180 / math.pi
-                glRotatef(angle_y, 0, 1, 0)
-
-                # Rotate around X axis to point upward/downward
-                angle_x = -math.atan2(dy, length_xz) * 180 / math.pi
-                glRotatef(angle_x, 1, 0, 0)
-
-            # Draw small cylinder segment
-            gluCylinder(quadric, tube_radius,
-                        tube_radius, segment_length, 8, 1)
-
-            # Draw cap at start (only for first segment)
-            if i == 0:
-                glPushMatrix()
-                glRotatef(180, 1, 0, 0)
-                gluDisk(quadric, 0, tube_radius, 8, 1)
-                glPopMatrix()
-
-            # Draw cap at end (only for last segment)
-            if i == steps - 1:
-                glPushMatrix()
-                glTranslatef(0, 0, segment_length)
-                gluDisk(quadric, 0, tube_radius, 8, 1)
-                glPopMatrix()
-
-            glPopMatrix()
-
-    gluDeleteQuadric(quadric)
+        _set_color(color)
+
+    def emit():
+        _emit_helix_tube(radius, -height / 2.0, height, turns, segments,
+                         lambda t: tube_radius, 8)
+
+    _call_geometry_list(("spiral", radius, height, turns, tube_radius, segments), emit)
+
     glPopMatrix()
 
 
@@ -841,75 +996,15 @@ def draw_curly_tail(base_radius=0.3, tip_radius=0.1, height=1.5, curl_radius=0.4
     glPushMatrix()
 
     if color:
-        if len(color) == 3:
-            glColor3f(*color)
-        else:
-            glColor4f(*color)
-
-    # Create quadric for segments
-    quadric = gluNewQuadric()
-    gluQuadricNormals(quadric, GLU_SMOOTH)
-
-    steps = segments
-    for i in range(steps):
-        t = i / float(steps)  # 0 to 1 (base to tip)
-
-        # Taper the thickness from base to tip
-        tube_radius = base_radius * (1 - t) + tip_radius * t
-
-        # Calculate position along spiral
-        angle = 2 * math.pi * turns * t
-        y = height * t  # Grow upward
-        x = curl_radius * math.cos(angle)
-        z = curl_radius * math.sin(angle)
-
-        # Calculate next position
-        t_next = (i + 1) / float(steps)
-        tube_radius_next = base_radius * (1 - t_next) + tip_radius * t_next
-        angle_next = 2 * math.pi * turns * t_next
-        y_next = height * t_next
-        x_next = curl_radius * math.cos(angle_next)
-        z_next = curl_radius * math.sin(angle_next)
-
-        # Direction vector
-        dx = x_next - x
-        dy = y_next - y
-        dz = z_next - z
-        segment_length = math.sqrt(dx*dx + dy*dy + dz*dz)
-
-        if segment_length > 0:
-            glPushMatrix()
-
-            # Move to current position
-            glTranslatef(x, y, z)
-
-            # Calculate rotation
-            length_xz = math.sqrt(dx*dx + dz*dz)
-            if length_xz > 0:
-                angle_y = math.atan2(dx, dz) * 180 / math.pi
-                glRotatef(angle_y, 0, 1, 0)
-                angle_x = -math.atan2(dy, length_xz) * 180 / math.pi
-                glRotatef(angle_x, 1, 0, 0)
-
-            # Draw tapered cylinder segment
-            gluCylinder(quadric, tube_radius, tube_radius_next,
-                        segment_length, 12, 1)
-
-            # Draw cap at start
-            if i == 0:
-                glPushMatrix()
-                glRotatef(180, 1, 0, 0)
-                gluDisk(quadric, 0, tube_radius, 12, 1)
-                glPopMatrix()
-
-            # Draw cap at end
-            if i == steps - 1:
-                glPushMatrix()
-                glTranslatef(0, 0, segment_length)
-                gluDisk(quadric, 0, tube_radius_next, 12, 1)
-                glPopMatrix()
-
-            glPopMatrix()
-
-    gluDeleteQuadric(quadric)
+        _set_color(color)
+
+    def emit():
+        # Thickness tapers linearly from base to tip; the tail grows upward
+        _emit_helix_tube(curl_radius, 0.0, height, turns, segments,
+                         lambda t: base_radius * (1 - t) + tip_radius * t, 12)
+
+    _call_geometry_list(
+        ("curly_tail", base_radius, tip_radius, height, curl_radius, turns, segments),
+        emit)
+
     glPopMatrix()
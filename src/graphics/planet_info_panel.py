@@ -4,10 +4,22 @@ from OpenGL.GL import *
 from src.graphics.ui_renderer import UIRenderer
 
 
+# Posibles rutas base de los JSON de planetas (la absoluta se resuelve una vez)
+_BASE_PATHS = (
+    "assets/data",
+    "../assets/data",
+    os.path.join(os.path.dirname(os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__)))), "assets", "data"),
+)
+
+
 class PlanetInfoPanel:
     TAB_ENCYCLOPEDIA = 0
     TAB_STRUCTURE = 1
 
+    # Datos ya cargados por nombre de planeta ({} si no hay archivo)
+    _data_cache = {}
+
     def __init__(self, planet_name, x, y, width, height):
         self.planet_name = planet_name
         self.x = x
@@ -38,25 +50,29 @@ class PlanetInfoPanel:
         self.tab_width = width / 2
 
     def _load_data(self):
+        """
+        Devuelve los datos JSON del planeta. Cada nombre se busca en disco una
+        sola vez; las aperturas siguientes (y los fallos) salen de la caché.
+        """
+        data = PlanetInfoPanel._data_cache.get(self.planet_name)
+        if data is None:
+            data = PlanetInfoPanel._read_data_file(self.planet_name)
+            PlanetInfoPanel._data_cache[self.planet_name] = data
+        return data
+
+    @staticmethod
+    def _read_data_file(planet_name):
         # Try to load from assets/data
-        filename = f"{self.planet_name}.json"
-
-        # Posibles rutas base
-        base_paths = [
-            "assets/data",
-            "../assets/data",
-            os.path.join(os.path.dirname(os.path.dirname(
-                os.path.dirname(__file__))), "assets", "data")
-        ]
-
-        for base in base_paths:
-            path = os.path.join(base, filename)
-            if not os.path.exists(path):
-                # Try capitalized
-                path = os.path.join(
-                    base, f"{self.planet_name.capitalize()}.json")
-
-            if os.path.exists(path):
+        # Nombre tal cual y capitalizado, sin repetir si ya coinciden
+        filenames = dict.fromkeys(
+            (f"{planet_name}.json", f"{planet_name.capitalize()}.json"))
+
+        for base in _BASE_PATHS:
+            for filename in filenames:
+                path = os.path.join(base, filename)
+                if not os.path.isfile(path):
+                    continue
+
                 print(f"[PlanetInfoPanel] Loading data from: {path}")
                 try:
                     with open(path, 'r') as f:
@@ -66,7 +82,7 @@ class PlanetInfoPanel:
                     return {}
 
         print(
-            f"[PlanetInfoPanel] Could not find data file for {self.planet_name}")
+            f"[PlanetInfoPanel] Could not find data file for {planet_name}")
         return {}
 
     def handle_click(self, x, y):
@@ -5,6 +5,93 @@ from OpenGL.GLUT import *
 from src.entities.base.renderable import Renderable
 
 
+# Paleta de colores estelares (Clases espectrales simplificadas)
+STAR_COLORS = [
+    (1.0, 1.0, 1.0),  # Blanco (Tipo A/F)
+    (0.6, 0.8, 1.0),  # Azulado (Tipo O/B)
+    (1.0, 1.0, 0.8),  # Amarillo pálido (Tipo G)
+    (1.0, 0.9, 0.6),  # Naranja (Tipo K)
+    (1.0, 0.4, 0.4),  # Rojo (Tipo M)
+]
+
+
+def _generate_star_field(half_size, seed=42):
+    """
+    Genera el campo de estrellas procedural como listas intercaladas
+    [r, g, b, x, y, z, ...] (formato GL_C3F_V3F).
+
+    Returns:
+        tuple: (estrellas de fondo, [(tamaño de punto, estrellas), ...] por galaxia)
+    """
+    rng = random.Random(seed)
+    uniform, choice, gauss = rng.uniform, rng.choice, rng.gauss
+
+    # 1. Campo de estrellas de fondo (Uniforme)
+    background = []
+    inner = half_size * 0.9
+    edge = half_size * 0.95
+    for _ in range(4000):
+        pos = [uniform(-half_size, half_size),
+               uniform(-half_size, half_size),
+               uniform(-half_size, half_size)]
+
+        # Proyectar hacia los bordes para que no queden en medio de la escena
+        # Si está dentro del 90% central, lo empujamos a una cara aleatoria
+        if abs(pos[0]) < inner and abs(pos[1]) < inner and abs(pos[2]) < inner:
+            axis = choice([0, 1, 2])
+            sign = choice([-1, 1])
+            pos[axis] = sign * edge
+
+        # Color y brillo aleatorio
+        r, g, b = choice(STAR_COLORS)
+        brightness = uniform(0.3, 1.0)
+        background += (r * brightness, g * brightness, b * brightness,
+                       pos[0], pos[1], pos[2])
+
+    # 2. Galaxias: centros aleatorios en la esfera lejana
+    galaxies = []
+    dist = half_size * 0.9
+    spread = half_size * 0.15  # Dispersión (Spread)
+    for _ in range(8):
+        # Dirección aleatoria
+        gx = uniform(-1, 1)
+        gy = uniform(-1, 1)
+        gz = uniform(-1, 1)
+        length = math.sqrt(gx*gx + gy*gy + gz*gz)
+        if length == 0:
+            continue
+
+        # Posicionar el centro de la galaxia en el borde del skybox
+        gx, gy, gz = (gx/length)*dist, (gy/length)*dist, (gz/length)*dist
+
+        # Tinte de la galaxia y estrellas un poco más grandes
+        tr, tg, tb = choice(STAR_COLORS)
+        point_size = choice([1.5, 2.0])
+
+        stars = []
+        for _ in range(rng.randint(200, 500)):
+            # Distribución Gaussiana alrededor del centro
+            sx = gx + gauss(0, spread)
+            sy = gy + gauss(0, spread)
+            sz = gz + gauss(0, spread)
+
+            # Variación de color mezclando con el tinte de la galaxia
+            brightness = uniform(0.5, 1.0)
+            stars += (tr * brightness, tg * brightness, tb * brightness,
+                      sx, sy, sz)
+        galaxies.append((point_size, stars))
+
+    return background, galaxies
+
+
+def _draw_points(data):
+    """Dibuja una lista intercalada [r, g, b, x, y, z, ...] como GL_POINTS."""
+    glInterleavedArrays(GL_C3F_V3F, 0, (GLfloat * len(data))(*data))
+    glDrawArrays(GL_POINTS, 0, len(data) // 6)
+    glDisableClientState(GL_COLOR_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+
 class Skybox(Renderable):
     """
     Fondo espacial representado por un cubo gigante.
@@ -41,88 +128,19 @@ class Skybox(Renderable):
             glColor3f(0.0, 0.0, 0.0)
             glutSolidCube(self.size)
 
-            rng = random.Random(42)
-
-            # Paleta de colores estelares (Clases espectrales simplificadas)
-            star_colors = [
-                (1.0, 1.0, 1.0),  # Blanco (Tipo A/F)
-                (0.6, 0.8, 1.0),  # Azulado (Tipo O/B)
-                (1.0, 1.0, 0.8),  # Amarillo pálido (Tipo G)
-                (1.0, 0.9, 0.6),  # Naranja (Tipo K)
-                (1.0, 0.4, 0.4),  # Rojo (Tipo M)
-            ]
+            # Las estrellas se generan en Python y se envían como arrays
+            # intercalados (color + posición): una llamada por grupo de puntos
+            # en lugar de un glColor3f/glVertex3f por estrella.
+            background, galaxies = _generate_star_field(half_size)
 
             # 1. Campo de estrellas de fondo (Uniforme)
             glPointSize(1.0)
-            glBegin(GL_POINTS)
-            for _ in range(4000):
-                x = rng.uniform(-half_size, half_size)
-                y = rng.uniform(-half_size, half_size)
-                z = rng.uniform(-half_size, half_size)
-
-                # Proyectar hacia los bordes para que no queden en medio de la escena
-                # Si está dentro del 80% central, lo empujamos a una cara aleatoria
-                if abs(x) < half_size * 0.9 and abs(y) < half_size * 0.9 and abs(z) < half_size * 0.9:
-                    axis = rng.choice([0, 1, 2])
-                    sign = rng.choice([-1, 1])
-                    if axis == 0:
-                        x = sign * half_size * 0.95
-                    elif axis == 1:
-                        y = sign * half_size * 0.95
-                    else:
-                        z = sign * half_size * 0.95
-
-                # Color y brillo aleatorio
-                base_color = rng.choice(star_colors)
-                brightness = rng.uniform(0.3, 1.0)
-                glColor3f(base_color[0] * brightness,
-                          base_color[1] * brightness,
-                          base_color[2] * brightness)
-                glVertex3f(x, y, z)
-            glEnd()
+            _draw_points(background)
 
-            # 2. Generación de "Galaxias" / Cúmulos estelares
-            # Generamos centros aleatorios en la esfera lejana
-            num_galaxies = 8
-            for _ in range(num_galaxies):
-                # Dirección aleatoria
-                gx = rng.uniform(-1, 1)
-                gy = rng.uniform(-1, 1)
-                gz = rng.uniform(-1, 1)
-                length = math.sqrt(gx*gx + gy*gy + gz*gz)
-                if length == 0:
-                    continue
-
-                # Posicionar el centro de la galaxia en el borde del skybox
-                dist = half_size * 0.9
-                gx, gy, gz = (gx/length)*dist, (gy/length) * \
-                    dist, (gz/length)*dist
-
-                # Tinte de la galaxia
-                galaxy_tint = rng.choice(star_colors)
-
-                # Dibujar estrellas de la galaxia
-                # Estrellas un poco más grandes
-                glPointSize(rng.choice([1.5, 2.0]))
-                glBegin(GL_POINTS)
-                num_stars_in_galaxy = rng.randint(200, 500)
-
-                # Dispersión (Spread)
-                spread = half_size * 0.15
-
-                for _ in range(num_stars_in_galaxy):
-                    # Distribución Gaussiana alrededor del centro
-                    sx = gx + rng.gauss(0, spread)
-                    sy = gy + rng.gauss(0, spread)
-                    sz = gz + rng.gauss(0, spread)
-
-                    # Variación de color mezclando con el tinte de la galaxia
-                    brightness = rng.uniform(0.5, 1.0)
-                    glColor3f(galaxy_tint[0] * brightness,
-                              galaxy_tint[1] * brightness,
-                              galaxy_tint[2] * brightness)
-                    glVertex3f(sx, sy, sz)
-                glEnd()
+            # 2. Galaxias / Cúmulos estelares
+            for point_size, stars in galaxies:
+                glPointSize(point_size)
+                _draw_points(stars)
 
     def draw(self):
         """
@@ -261,7 +261,8 @@ class GameCompleteState(BaseState):
                 glPushMatrix()
                 glTranslatef(x_pos, 0.5, z_pos)
                 self.trophy_renderer.render_trophy(
-                    planet, 0, 0, 0, scale, self.trophy_rotation * 0.5)
+                    planet, 0, 0, 0, scale, self.trophy_rotation * 0.5,
+                    low_detail=True)
                 glPopMatrix()
 
         glDisable(GL_LIGHTING)
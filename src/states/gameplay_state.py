@@ -10,6 +10,7 @@ from src.entities.celestial.ringed_planet import RingedPlanet
 from src.entities.celestial.asteroid_belt import AsteroidBelt
 from src.entities.player.ship import Ship
 from src.graphics.skybox import Skybox
+from src.graphics.draw_utils import prewarm
 from src.core.resource_loader import ResourceManager
 from src.utils.math_helper import check_collision
 from src.graphics.ui_renderer import UIRenderer
@@ -122,6 +123,8 @@ class GameplayState(BaseState):
             # Random spawn location within safe bounds
             spawn_pos = self._get_random_spawn_position()
             self.ship = Ship(position=spawn_pos)
+            # Compilar las display lists de la nave ahora y no en el primer frame
+            prewarm([(self.ship.draw, {})])
             # Use follow camera for gameplay (not orbital)
             self.camera.mode = Camera.MODE_FOLLOW
             self.camera.follow_target = self.ship
@@ -537,15 +540,10 @@ class GameplayState(BaseState):
             desired_z = target_z - (-math.cos(rad) * offset_dist)
             desired_y = target_y + offset_height
 
-            lerp_factor = self.camera.follow_smoothness * dt
-            self.camera.position[0] += (desired_x -
-                                        self.camera.position[0]) * lerp_factor
-            self.camera.position[1] += (desired_y -
-                                        self.camera.position[1]) * lerp_factor
-            self.camera.position[2] += (desired_z -
-                                        self.camera.position[2]) * lerp_factor
+            lerp_factor = self.camera.follow_lerp_factor(dt)
+            self.camera.ease_position(desired_x, desired_y, desired_z, lerp_factor)
 
-            self.camera.target = [target_x, target_y, target_z]
+            self.camera.target[:] = (target_x, target_y, target_z)
         else:
             self.camera.update(dt)
 
@@ -827,6 +825,11 @@ class GameplayState(BaseState):
             if entity != self.sun:
                 entity.draw()
 
+        # Grupo sin culling: la nave (modelos abiertos / winding mixto), el
+        # asteroide de impacto y la explosión se dibujan juntos para cambiar
+        # GL_CULL_FACE una sola vez por frame.
+        glDisable(GL_CULL_FACE)
+
         # Dibujar la Nave (Solo si estamos en modo FOLLOW/Nave y no está muerta)
         if self.ship and self.camera.mode == Camera.MODE_FOLLOW and not self.is_dead:
             self.ship.draw()
@@ -841,6 +844,8 @@ class GameplayState(BaseState):
         if self.explosion_particles:
             self._draw_explosion()
 
+        glEnable(GL_CULL_FACE)
+
         # 5. UI Overlay
         w = glutGet(GLUT_WINDOW_WIDTH)
         h = glutGet(GLUT_WINDOW_HEIGHT)
@@ -222,7 +222,7 @@ class PlanetDetailState(BaseState):
 
         # Clear Space key from InputManager to prevent accidental boost in GameplayState
         from src.core.input_manager import InputManager
-        InputManager().key_state[' '] = False
+        InputManager().release_key(' ')
 
     def update(self, dt):
         # Animar apertura
@@ -14,3 +14,114 @@ def check_collision(pos1, pos2, radius_sum):
     radius_sq = radius_sum * radius_sum
 
     return dist_sq < radius_sq
+
+
+def quat_from_axis_angle(axis, angle):
+    """
+    Cuaternión unitario (w, x, y, z) para una rotación de `angle` grados
+    alrededor de un eje unitario.
+    """
+    half = math.radians(angle) * 0.5
+    s = math.sin(half)
+    return (math.cos(half), axis[0] * s, axis[1] * s, axis[2] * s)
+
+
+def quat_multiply(a, b):
+    """Producto de Hamilton a * b (aplica b primero, luego a)."""
+    aw, ax, ay, az = a
+    bw, bx, by, bz = b
+    return (
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    )
+
+
+def quat_nlerp(a, b, t):
+    """
+    Interpolación lineal normalizada de a hacia b (camino corto).
+    Más barata que SLERP y suficiente para suavizado por frame.
+    """
+    aw, ax, ay, az = a
+    bw, bx, by, bz = b
+    if aw * bw + ax * bx + ay * by + az * bz < 0.0:
+        bw, bx, by, bz = -bw, -bx, -by, -bz
+
+    u = 1.0 - t
+    w = u * aw + t * bw
+    x = u * ax + t * bx
+    y = u * ay + t * by
+    z = u * az + t * bz
+    inv_len = 1.0 / math.sqrt(w * w + x * x + y * y + z * z)
+    return (w * inv_len, x * inv_len, y * inv_len, z * inv_len)
+
+
+def quat_to_matrix(q, scale=1.0):
+    """
+    Matriz 4x4 column-major (lista para glMultMatrixf) de la rotación `q`
+    con escala uniforme `scale` aplicada después.
+    """
+    w, x, y, z = q
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+    s2 = 2.0 * scale
+
+    return [
+        scale - s2 * (yy + zz), s2 * (xy + wz), s2 * (xz - wy), 0.0,
+        s2 * (xy - wz), scale - s2 * (xx + zz), s2 * (yz + wx), 0.0,
+        s2 * (xz + wy), s2 * (yz - wx), scale - s2 * (xx + yy), 0.0,
+        0.0, 0.0, 0.0, 1.0,
+    ]
+
+
+def euler_to_matrix(position, rotation, scale=1.0, pivot=(0.0, 0.0, 0.0)):
+    """
+    Matriz 4x4 column-major equivalente a
+    glTranslatef(position) · glRotatef(yaw, Y) · glRotatef(pitch, X) ·
+    glRotatef(roll, Z) · glScalef(scale) · glTranslatef(pivot).
+
+    rotation es (pitch, yaw, roll) en grados, como en ShipModel.
+    """
+    pitch, yaw, roll = (math.radians(a) for a in rotation)
+    cp, sp = math.cos(pitch), math.sin(pitch)
+    cy, sy = math.cos(yaw), math.sin(yaw)
+    cr, sr = math.cos(roll), math.sin(roll)
+
+    # R = Ry · Rx · Rz
+    r00, r01, r02 = cy * cr + sy * sp * sr, sy * sp * cr - cy * sr, sy * cp
+    r10, r11, r12 = cp * sr, cp * cr, -sp
+    r20, r21, r22 = cy * sp * sr - sy * cr, sy * sr + cy * sp * cr, cy * cp
+
+    px, py, pz = pivot
+    tx = position[0] + scale * (r00 * px + r01 * py + r02 * pz)
+    ty = position[1] + scale * (r10 * px + r11 * py + r12 * pz)
+    tz = position[2] + scale * (r20 * px + r21 * py + r22 * pz)
+
+    return [
+        scale * r00, scale * r10, scale * r20, 0.0,
+        scale * r01, scale * r11, scale * r21, 0.0,
+        scale * r02, scale * r12, scale * r22, 0.0,
+        tx, ty, tz, 1.0,
+    ]
+
+
+def translate_rotate_matrix(position, angle, axis):
+    """
+    Matriz 4x4 column-major equivalente a
+    glTranslatef(position) · glRotatef(angle, *axis), con angle en grados.
+    """
+    x, y, z = axis
+    norm = math.sqrt(x * x + y * y + z * z)
+    x, y, z = x / norm, y / norm, z / norm
+    rad = math.radians(angle)
+    c, s = math.cos(rad), math.sin(rad)
+    t = 1.0 - c
+
+    return [
+        c + t * x * x, t * x * y + s * z, t * x * z - s * y, 0.0,
+        t * x * y - s * z, c + t * y * y, t * y * z + s * x, 0.0,
+        t * x * z + s * y, t * y * z - s * x, c + t * z * z, 0.0,
+        position[0], position[1], position[2], 1.0,
+    ]